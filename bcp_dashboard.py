@@ -10,14 +10,23 @@ Usage:
     python F:/claude_tools/bcp_dashboard.py [--project-path PATH]
 """
 
+import io
 import json
 import os
 import re
 import shlex
+import shutil
 import subprocess
 import sys
+import tempfile
 import threading
 import argparse
+import codecs
+import functools
+import itertools
+import bisect
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from pathlib import Path
@@ -35,8 +44,29 @@ DEFAULT_PROJECT = Path('F:/Better_Compaction_Protocol')
 # Characters prohibited in Windows filenames + our separator + whitespace
 PROHIBITED = set('\\/:*?"<>|~\t\n\r\x0b\x0c ')
 
+# Summary lines the ToolsTab colors as headers
+HEADER_LINE_RE = re.compile(r'\s*(?:Verification rate|Severity-weighted|TOTALS)')
+
+# Archive filenames: session_DATE_ID[~TAGS][.enrichedN].md in one anchored
+# pass. Names that don't fit fall back to the looser per-field patterns.
+ARCHIVE_NAME_RE = re.compile(
+    r'session_(\d{4}-\d{2}-\d{2})_([a-f0-9]{8})[a-f0-9]*'
+    r'(?:~([^.]*))?(?:\.enriched(\d*))?\.md\Z'
+)
+ENRICHED_RE = re.compile(r'\.enriched(\d*)\.md')
+SESSION_PREFIX_RE = re.compile(r'session_(\d{4}-\d{2}-\d{2})_([a-f0-9]+)')
+
+# Compaction summary characters shown in the Reports tab; longer summaries
+# are cut to this at load time so the full text isn't kept in memory
+SUMMARY_PREVIEW_CHARS = 2000
+
+# Tool output backscroll: past OUTPUT_MAX_LINES, trim down to the last
+# OUTPUT_KEEP_LINES. The full log is still kept for export.
+OUTPUT_MAX_LINES = 10000
+OUTPUT_KEEP_LINES = 5000
+
 # BCP tools with default argument templates
-# {project} and {archive} are replaced at runtime
+# {project} and {archive} are filled in with str.format at runtime
 TOOLS = [
     {
         'name': 'Context Preserver',
@@ -75,35 +105,225 @@ TOOLS = [
 # Character pool
 # ---------------------------------------------------------------------------
 
+# Unicode blocks offered in the Semantic Map, as (name, start, end)
+CHAR_POOL_BLOCKS = (
+    ('ASCII', 33, 127),
+    ('Latin-1 Supplement', 161, 256),
+    ('Latin Extended-A', 256, 384),
+    ('Greek', 880, 1024),
+    ('Cyrillic', 1024, 1280),
+    ('Currency', 8352, 8400),
+    ('Arrows', 8592, 8704),
+    ('Math Operators', 8704, 8960),
+    ('Box Drawing', 9472, 9600),
+    ('Geometric Shapes', 9632, 9728),
+    ('Misc Symbols', 9728, 9984),
+)
+
+
+def _collect_pool():
+    sections = []
+    for name, start, end in CHAR_POOL_BLOCKS:
+        chars = tuple(c for c in map(chr, range(start, end))
+                      if c.isprintable() and not c.isspace() and c not in PROHIBITED)
+        # Filter out empty sections
+        if chars:
+            sections.append((name, chars))
+    return tuple(sections)
+
+
+# The pool depends only on PROHIBITED, so build it once at import
+CHAR_POOL = _collect_pool()
+CHAR_POOL_TOTAL = sum(len(chars) for _, chars in CHAR_POOL)
+
+
 def build_character_pool():
-    """Build valid filename characters organized by Unicode block.
+    """Valid filename characters organized by Unicode block.
 
-    Returns list of (section_name, [chars]) tuples.
+    Returns tuple of (section_name, (chars...)) tuples, precomputed at import.
     """
-    sections = []
+    return CHAR_POOL
+
 
-    def _collect(start, end):
-        out = []
-        for i in range(start, end):
-            c = chr(i)
-            if c.isprintable() and c not in PROHIBITED and not c.isspace():
-                out.append(c)
-        return out
-
-    sections.append(('ASCII', _collect(33, 127)))
-    sections.append(('Latin-1 Supplement', _collect(161, 256)))
-    sections.append(('Latin Extended-A', _collect(256, 384)))
-    sections.append(('Greek', _collect(880, 1024)))
-    sections.append(('Cyrillic', _collect(1024, 1280)))
-    sections.append(('Currency', _collect(8352, 8400)))
-    sections.append(('Arrows', _collect(8592, 8704)))
-    sections.append(('Math Operators', _collect(8704, 8960)))
-    sections.append(('Box Drawing', _collect(9472, 9600)))
-    sections.append(('Geometric Shapes', _collect(9632, 9728)))
-    sections.append(('Misc Symbols', _collect(9728, 9984)))
-
-    # Filter out empty sections
-    return [(name, chars) for name, chars in sections if chars]
+# ---------------------------------------------------------------------------
+# Virtual table
+# ---------------------------------------------------------------------------
+
+class VirtualTreeview:
+    """Treeview that only materializes the rows currently on screen.
+
+    The full row list lives in Python. A fixed set of Treeview items (one per
+    visible line) is reused and rewritten as the view scrolls, so loading
+    thousands of rows costs no more Tk work than loading a screenful.
+    Indices passed to on_select / returned by selected_index() refer to the
+    full row list.
+    """
+
+    def __init__(self, parent, col_config, height=10, anchor=None, on_select=None):
+        self.tree = ttk.Treeview(parent, columns=[c[0] for c in col_config],
+                                 show='headings', height=height, selectmode='browse')
+        for col_id, heading, width in col_config:
+            self.tree.heading(col_id, text=heading)
+            if anchor:
+                self.tree.column(col_id, width=width, anchor=anchor)
+            else:
+                self.tree.column(col_id, width=width)
+        self.scrollbar = ttk.Scrollbar(parent, orient='vertical', command=self.yview)
+
+        self.rows = []
+        self.row_tags = None
+        self.first = 0          # row index shown in the top slot
+        self.visible = height   # number of slots that fit in the widget
+        self.selected = None    # selected row index, or None
+        self.on_select = on_select
+        self._slots = []        # reusable Treeview item ids, top to bottom
+        self._height = None     # widget height from the last <Configure>
+        self._row_metrics = None  # (header height, row height) from a live item
+        self._fit_job = None
+
+        self.tree.bind('<Configure>', self._on_configure)
+        self.tree.bind('<<TreeviewSelect>>', self._on_tree_select)
+        self.tree.bind('<MouseWheel>', self._on_wheel)
+        self.tree.bind('<Button-4>', lambda e: self._scroll_by(-3))
+        self.tree.bind('<Button-5>', lambda e: self._scroll_by(3))
+        self.tree.bind('<Up>', lambda e: self._move_selection(-1))
+        self.tree.bind('<Down>', lambda e: self._move_selection(1))
+        self.tree.bind('<Prior>', lambda e: self._move_selection(-self.visible))
+        self.tree.bind('<Next>', lambda e: self._move_selection(self.visible))
+        self.tree.bind('<Home>', lambda e: self._move_selection(-len(self.rows)))
+        self.tree.bind('<End>', lambda e: self._move_selection(len(self.rows)))
+
+    def set_rows(self, rows, tags=None):
+        """Replace the table contents. tags, if given, parallels rows."""
+        self.rows = rows
+        self.row_tags = tags
+        self.first = 0
+        self.selected = None
+        self._repaint()
+
+    def selected_index(self):
+        return self.selected
+
+    def yview(self, *args):
+        """Scrollbar command: 'moveto FRACTION' or 'scroll N units|pages'."""
+        if args[0] == 'moveto':
+            self._scroll_to(int(float(args[1]) * len(self.rows)))
+        elif args[0] == 'scroll':
+            n = int(args[1])
+            self._scroll_by(n * self.visible if args[2] == 'pages' else n)
+
+    def _scroll_by(self, n):
+        self._scroll_to(self.first + n)
+        return 'break'
+
+    def _scroll_to(self, first):
+        first = max(0, min(first, len(self.rows) - self.visible))
+        if first != self.first:
+            self.first = first
+            self._repaint()
+
+    def _on_wheel(self, event):
+        # Windows reports multiples of 120 per notch, macOS small deltas
+        notches = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        return self._scroll_by(-3 * notches)
+
+    def _move_selection(self, delta):
+        if not self.rows:
+            return 'break'
+        current = self.selected if self.selected is not None else self.first - 1
+        idx = max(0, min(current + delta, len(self.rows) - 1))
+        changed = idx != self.selected
+        self.selected = idx
+        self._scroll_into_view(idx)
+        slot = idx - self.first
+        if 0 <= slot < len(self._slots):
+            self.tree.selection_set(self._slots[slot])
+            self.tree.focus(self._slots[slot])
+            self.tree.see(self._slots[slot])
+        if changed and self.on_select:
+            self.on_select(idx)
+        return 'break'
+
+    def _scroll_into_view(self, idx):
+        if idx < self.first:
+            self._scroll_to(idx)
+        elif idx >= self.first + self.visible:
+            self._scroll_to(idx - self.visible + 1)
+        else:
+            self._repaint()
+
+    def _on_configure(self, event):
+        self._height = event.height
+        self._fit()
+
+    def _fit(self):
+        """Set the slot count from the widget height and the row metrics."""
+        self._fit_job = None
+        if self._height is None:
+            return
+        # The first <Configure> comes before any rows exist, so start from
+        # the style's row height and re-measure from a live item once painted
+        bbox = self.tree.bbox(self._slots[0]) if self._slots else ''
+        if bbox:
+            self._row_metrics = (bbox[1], bbox[3])
+        top, row_h = self._row_metrics or self._style_metrics()
+        visible = max(1, (self._height - top) // max(1, row_h))
+        if visible != self.visible:
+            self.visible = visible
+            self.first = max(0, min(self.first, len(self.rows) - visible))
+            self._repaint()
+
+    def _style_metrics(self):
+        """(header height, row height) estimated before any item is drawn."""
+        try:
+            row_h = int(ttk.Style(self.tree).lookup('Treeview', 'rowheight'))
+        except (ValueError, tk.TclError):
+            row_h = 20
+        return row_h + 4, row_h
+
+    def _on_tree_select(self, _event):
+        sel = self.tree.selection()
+        if not sel or sel[0] not in self._slots:
+            return
+        idx = self.first + self._slots.index(sel[0])
+        if idx >= len(self.rows) or idx == self.selected:
+            return
+        self.selected = idx
+        if self.on_select:
+            self.on_select(idx)
+
+    def _repaint(self):
+        count = max(0, min(self.visible, len(self.rows) - self.first))
+
+        # Grow or shrink the pool of reusable items to match
+        while len(self._slots) < count:
+            self._slots.append(self.tree.insert('', 'end'))
+        if len(self._slots) > count:
+            self.tree.delete(*self._slots[count:])
+            del self._slots[count:]
+
+        tags = self.row_tags
+        for i, iid in enumerate(self._slots):
+            row = self.first + i
+            self.tree.item(iid, values=self.rows[row],
+                           tags=tags[row] if tags else ())
+
+        # Keep the highlight on the selected row, not on its old slot
+        slot = None if self.selected is None else self.selected - self.first
+        if slot is not None and 0 <= slot < count:
+            self.tree.selection_set(self._slots[slot])
+        elif self.tree.selection():
+            self.tree.selection_remove(*self.tree.selection())
+
+        total = len(self.rows)
+        if total:
+            self.scrollbar.set(self.first / total, (self.first + count) / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+        # Row metrics are only known once an item has been laid out
+        if self._row_metrics is None and self._slots and self._fit_job is None:
+            self._fit_job = self.tree.after_idle(self._fit)
 
 
 # ---------------------------------------------------------------------------
@@ -158,14 +378,11 @@ class SemanticMapTab:
         self.text.tag_bind('mapped', '<Button-1>', self._on_char_click)
         self.text.tag_bind('unmapped', '<Button-1>', self._on_char_click)
 
-        self.char_positions = {}  # tag_name -> char
-
     def refresh(self):
         mappings = self.app.semantic_map.get('mappings', {})
-        reverse_map = {c: topic for c, topic in mappings.items()}
-        pool = build_character_pool()
+        mapped = mappings.keys()
 
-        total = sum(len(chars) for _, chars in pool)
+        total = CHAR_POOL_TOTAL
         mapped_count = len(mappings)
         unmapped_count = total - mapped_count
 
@@ -174,69 +391,65 @@ class SemanticMapTab:
 
         self.text.configure(state='normal')
         self.text.delete('1.0', 'end')
-        self.char_positions.clear()
-
-        for section_name, chars in pool:
-            self.text.insert('end', f'\n{section_name}', 'section_header')
-            self.text.insert('end', f'  ({len(chars)} chars)\n', 'section_header')
 
+        for section_name, chars in CHAR_POOL:
+            # Collect the whole section as (chars, tags) pairs and hand it to
+            # Tk in a single insert call instead of one round-trip per char.
+            # Clicks are dispatched by the 'mapped'/'unmapped' tag bindings.
+            segments = [f'\n{section_name}  ({len(chars)} chars)\n', 'section_header']
             for i, c in enumerate(chars):
-                tag_id = f'c_{ord(c)}'
-                if c in reverse_map:
-                    self.text.insert('end', f' {c} ', ('mapped', tag_id))
-                else:
-                    self.text.insert('end', f' {c} ', ('unmapped', tag_id))
-                self.char_positions[tag_id] = c
+                segments.append(f' {c} ')
+                segments.append('mapped' if c in mapped else 'unmapped')
 
                 if (i + 1) % self.CHARS_PER_ROW == 0:
-                    self.text.insert('end', '\n')
-
-                # Bind individual character tag
-                self.text.tag_bind(tag_id, '<Button-1>', self._on_char_click)
+                    segments.append('\n')
+                    segments.append(())
 
-            self.text.insert('end', '\n')
+            segments.append('\n')
+            self.text.insert('end', *segments)
 
         self.text.configure(state='disabled')
 
     def _export_map(self):
         mappings = self.app.semantic_map.get('mappings', {})
-        pool = build_character_pool()
-        total = sum(len(chars) for _, chars in pool)
-
-        lines = [f'Semantic Map Export — {len(mappings)} mapped / '
-                 f'{total - len(mappings)} unmapped / {total} total\n']
-        lines.append('MAPPED CHARACTERS:')
-        for char, topic in sorted(mappings.items(), key=lambda x: x[1].lower()):
-            lines.append(f'  {char}  (U+{ord(char):04X})  →  {topic}')
-        lines.append(f'\nUNMAPPED ({total - len(mappings)} available)')
-        for section_name, chars in pool:
-            unmapped = [c for c in chars if c not in mappings]
+        mapped = mappings.keys()
+        total = CHAR_POOL_TOTAL
+
+        buf = io.StringIO()
+        w = buf.write
+        w(f'Semantic Map Export — {len(mappings)} mapped / '
+          f'{total - len(mappings)} unmapped / {total} total\n\n')
+        w('MAPPED CHARACTERS:\n')
+        for char, topic in sorted(mappings.items(), key=lambda x: x[1].casefold()):
+            w(f'  {char}  (U+{ord(char):04X})  →  {topic}\n')
+        w(f'\nUNMAPPED ({total - len(mappings)} available)\n')
+        for section_name, chars in CHAR_POOL:
+            unmapped = [c for c in chars if c not in mapped]
             if unmapped:
-                lines.append(f'  {section_name}: {"  ".join(unmapped)}')
+                w(f'  {section_name}: {"  ".join(unmapped)}\n')
         try:
-            path = self.app.export_file('semantic_map_export', '\n'.join(lines))
+            path = self.app.export_file('semantic_map_export', buf.getvalue())
             self.detail_var.set(f'Exported: {path.name}')
         except OSError as e:
             messagebox.showerror('Export Error', str(e))
 
     def _on_char_click(self, event):
-        # Find which character tag was clicked
+        # Each grid cell is ' c ' starting at column 0, so the clicked
+        # character sits in the middle of its 3-column cell
         idx = self.text.index(f'@{event.x},{event.y}')
-        tags = self.text.tag_names(idx)
-        for t in tags:
-            if t.startswith('c_'):
-                c = self.char_positions.get(t, '')
-                if c:
-                    mappings = self.app.semantic_map.get('mappings', {})
-                    if c in mappings:
-                        self.detail_var.set(
-                            f'Character: {c}  (U+{ord(c):04X})    '
-                            f'Topic: {mappings[c]}    Status: MAPPED')
-                    else:
-                        self.detail_var.set(
-                            f'Character: {c}  (U+{ord(c):04X})    '
-                            f'Status: unmapped — available for assignment')
-                break
+        line, col = idx.split('.')
+        c = self.text.get(f'{line}.{int(col) // 3 * 3 + 1}').strip()
+        if not c:
+            return
+        mappings = self.app.semantic_map.get('mappings', {})
+        if c in mappings:
+            self.detail_var.set(
+                f'Character: {c}  (U+{ord(c):04X})    '
+                f'Topic: {mappings[c]}    Status: MAPPED')
+        else:
+            self.detail_var.set(
+                f'Character: {c}  (U+{ord(c):04X})    '
+                f'Status: unmapped — available for assignment')
 
 
 # ---------------------------------------------------------------------------
@@ -249,6 +462,8 @@ class BlacklistTab:
     def __init__(self, notebook, app):
         self.app = app
         self.frame = ttk.Frame(notebook)
+        self._words = None
+        self._last_len = 0
 
         ttk.Label(self.frame, text='Blacklisted words are excluded from topic extraction',
                   font=('Segoe UI', 10)).pack(anchor='w', padx=8, pady=(8, 4))
@@ -285,39 +500,53 @@ class BlacklistTab:
                    command=self._export_list).pack(side='right')
 
     def refresh(self):
-        words = sorted(self.app.semantic_map.get('blacklist', []),
-                       key=str.lower)
+        # The loader keeps the blacklist sorted and every edit goes through
+        # this tab, so an unchanged list needs no listbox rebuild
+        words = self.app.semantic_map.setdefault('blacklist', [])
+        if words is self._words and len(words) == self._last_len:
+            return
+        # Sorted display order plus lowercase keys for bisect and a set for
+        # membership, kept in step with the listbox by _add_word/_remove_selected
+        self._words = words
+        self._keys = [w.lower() for w in words]
+        self._word_set = set(words)
         self.listbox.delete(0, 'end')
-        for w in words:
-            self.listbox.insert('end', w)
-        self.count_var.set(f'{len(words)} words blacklisted')
+        self.listbox.insert('end', *words)
+        self._update_count()
+
+    def _update_count(self):
+        self._last_len = len(self._words)
+        self.count_var.set(f'{len(self._words)} words blacklisted')
 
     def _add_word(self):
         word = self.add_var.get().strip().lower()
         if not word:
             return
-        bl = self.app.semantic_map.setdefault('blacklist', [])
-        if word not in bl:
-            bl.append(word)
-            bl.sort(key=str.lower)
-            self.app.save_semantic_map()
-            self.refresh()
+        if word not in self._word_set:
+            pos = bisect.bisect_left(self._keys, word)
+            self._words.insert(pos, word)
+            self._keys.insert(pos, word)
+            self._word_set.add(word)
+            self.listbox.insert(pos, word)
+            self.app.schedule_save_semantic_map()
+            self._update_count()
         self.add_var.set('')
 
     def _remove_selected(self):
         sel = self.listbox.curselection()
         if not sel:
             return
-        words_to_remove = [self.listbox.get(i) for i in sel]
-        bl = self.app.semantic_map.get('blacklist', [])
-        for w in words_to_remove:
-            if w in bl:
-                bl.remove(w)
-        self.app.save_semantic_map()
-        self.refresh()
+        for i in sorted(sel, reverse=True):
+            del self._words[i]
+            del self._keys[i]
+            self.listbox.delete(i)
+        # The list may hold duplicates, so rebuild from what is left
+        self._word_set = set(self._words)
+        self.app.schedule_save_semantic_map()
+        self._update_count()
 
     def _export_list(self):
-        words = sorted(self.app.semantic_map.get('blacklist', []), key=str.lower)
+        words = self._words
         if not words:
             return
         content = f'Blacklist Export — {len(words)} words\n\n' + '\n'.join(words)
@@ -339,6 +568,16 @@ class ToolsTab:
         self.app = app
         self.frame = ttk.Frame(notebook)
         self.running_proc = None
+        # Output lines handed from the worker thread to the Tk thread
+        self._pending = deque()
+        self._exit_code = None
+        # Everything written to the output widget, for export without a Tk get()
+        self._log = []
+        # Rendered default args per tool, rebuilt when the project path changes
+        self._args_project = None
+        self._args_cache = []
+        # Command prefix per tool (interpreter + absolute script path)
+        self._tool_cmds = [[sys.executable, str(TOOLS_DIR / t['script'])] for t in TOOLS]
 
         # Tool selector
         top = ttk.Frame(self.frame)
@@ -414,13 +653,18 @@ class ToolsTab:
         idx = self.tool_combo.current()
         if idx < 0:
             return
-        tool = TOOLS[idx]
-        self.desc_var.set(tool['desc'])
-
-        project = str(self.app.project_path)
-        archive = str(self.app.project_path / 'context_archive')
-        args = tool['default_args'].replace('{project}', project).replace('{archive}', archive)
-        self.args_var.set(args)
+        self.desc_var.set(TOOLS[idx]['desc'])
+        self.args_var.set(self._tool_args()[idx])
+
+    def _tool_args(self):
+        """Default args for every tool, rendered for the current project."""
+        if self._args_project != self.app.project_path:
+            project = str(self.app.project_path)
+            archive = str(self.app.project_path / 'context_archive')
+            self._args_cache = [t['default_args'].format(project=project, archive=archive)
+                                for t in TOOLS]
+            self._args_project = self.app.project_path
+        return self._args_cache
 
     def _run_tool(self):
         if self.running_proc is not None:
@@ -431,58 +675,97 @@ class ToolsTab:
         if idx < 0:
             return
         tool = TOOLS[idx]
-        script = str(TOOLS_DIR / tool['script'])
         args_str = self.args_var.get().strip()
 
-        cmd = [sys.executable, script] + shlex.split(args_str)
+        cmd = self._tool_cmds[idx] + shlex.split(args_str)
 
         # Add separator in output
-        self.output.configure(state='normal')
         ts = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        self.output.insert('end', f'\n{"="*64}\n', 'separator')
-        self.output.insert('end', f'  [{ts}] Running: {tool["name"]}\n', 'timestamp')
-        self.output.insert('end', f'  {" ".join(cmd)}\n', 'timestamp')
-        self.output.insert('end', f'{"="*64}\n', 'separator')
-        self.output.configure(state='disabled')
+        self._write_output([
+            f'\n{"="*64}\n', 'separator',
+            f'  [{ts}] Running: {tool["name"]}\n  {" ".join(cmd)}\n', 'timestamp',
+            f'{"="*64}\n', 'separator',
+        ])
 
         self.run_btn.configure(state='disabled')
         self.status_var.set('Running...')
 
-        # Run in background thread
+        # Run in background thread; output is drained on the Tk thread
+        self._pending.clear()
+        self._exit_code = None
         thread = threading.Thread(target=self._execute, args=(cmd,), daemon=True)
         thread.start()
+        self.frame.after(50, self._drain)
 
     def _execute(self, cmd):
+        # Runs on the worker thread: never touch widgets here
         try:
+            # close_fds=False skips the handle-list setup on Windows; the
+            # POSIX default (True) is kept elsewhere
             proc = subprocess.Popen(
-                cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-                text=True, encoding='utf-8', errors='replace',
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=0,
+                close_fds=sys.platform != 'win32',
                 creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
             )
             self.running_proc = proc
 
-            for line in proc.stdout:
-                self.frame.after(0, self._append_line, line)
+            # Read the raw pipe in large chunks and split lines ourselves.
+            # A blocking os.read is fine on this thread (select() can't wait
+            # on Windows pipes); the incremental decoder handles multi-byte
+            # characters split across chunks.
+            fd = proc.stdout.fileno()
+            decoder = codecs.getincrementaldecoder('utf-8')('replace')
+            tail = ''
+            while True:
+                chunk = os.read(fd, 65536)
+                text = tail + decoder.decode(chunk, final=not chunk)
+                lines = text.split('\n')
+                tail = lines.pop()
+                self._pending.extend(line.rstrip('\r') + '\n' for line in lines)
+                if not chunk:
+                    break
+            if tail:
+                self._pending.append(tail)
+            proc.stdout.close()
 
             proc.wait()
-            exit_code = proc.returncode
-            self.frame.after(0, self._on_finished, exit_code)
+            self._exit_code = proc.returncode
 
         except Exception as e:
-            self.frame.after(0, self._append_line, f'ERROR: {e}\n')
-            self.frame.after(0, self._on_finished, -1)
+            self._pending.append(f'ERROR: {e}\n')
+            self._exit_code = -1
+
+    def _drain(self):
+        """Flush queued output in one insert, then poll again until exit."""
+        # Read the exit code first: it is only set after the last line is queued
+        exit_code = self._exit_code
+
+        # Group consecutive lines with the same tag into one segment
+        runs = []  # (tag, [lines])
+        for _ in range(len(self._pending)):
+            line = self._pending.popleft()
+            tag = self._classify_line(line)
+            if runs and runs[-1][0] == tag:
+                runs[-1][1].append(line)
+            else:
+                runs.append((tag, [line]))
 
-    def _append_line(self, line):
-        self.output.configure(state='normal')
-        tag = self._classify_line(line)
-        self.output.insert('end', line, tag)
-        self.output.see('end')
-        self.output.configure(state='disabled')
+        if runs:
+            segments = []
+            for tag, lines in runs:
+                segments.append(''.join(lines))
+                segments.append(tag)
+            self._write_output(segments)
+
+        if exit_code is None:
+            self.frame.after(50, self._drain)
+        else:
+            self._on_finished(exit_code)
 
     def _classify_line(self, line):
-        stripped = line.strip()
-        if stripped.startswith('===') or stripped.startswith('---'):
+        if line.lstrip()[:3] in ('===', '---'):
             return 'separator'
+        # Plain substring tests, in priority order: cheaper than any regex
         if '[FOUND]' in line:
             return 'found'
         if '[DEEP]' in line:
@@ -495,7 +778,7 @@ class ToolsTab:
             return 'critical'
         if 'MAJOR' in line:
             return 'major'
-        if re.match(r'\s*(Verification rate|Severity-weighted|TOTALS)', line):
+        if HEADER_LINE_RE.match(line):
             return 'header'
         return ''
 
@@ -507,8 +790,19 @@ class ToolsTab:
         else:
             self.status_var.set(f'Done (exit {exit_code})')
 
+    def _write_output(self, segments):
+        """Append alternating text/tag segments to the output and the log."""
+        self.output.configure(state='normal')
+        self.output.insert('end', *segments)
+        lines = int(self.output.index('end-1c').split('.')[0])
+        if lines > OUTPUT_MAX_LINES:
+            self.output.delete('1.0', f'end-{OUTPUT_KEEP_LINES} lines')
+        self.output.see('end')
+        self.output.configure(state='disabled')
+        self._log.extend(segments[::2])
+
     def _export_log(self):
-        content = self.output.get('1.0', 'end').strip()
+        content = ''.join(self._log).strip()
         if not content:
             self.status_var.set('Nothing to export')
             return
@@ -522,6 +816,94 @@ class ToolsTab:
         self.output.configure(state='normal')
         self.output.delete('1.0', 'end')
         self.output.configure(state='disabled')
+        self._log.clear()
+
+
+# ---------------------------------------------------------------------------
+# Audit history reader
+# ---------------------------------------------------------------------------
+
+class HistoryTail:
+    """Incremental reader for an append-only JSONL file (audit_history.jsonl).
+
+    Each read() parses only the bytes appended since the last one. Reads
+    follow the same rules as a full read of the file:
+
+    - Only newline-terminated lines are committed; the read offset never
+      moves past the last newline.
+    - Parsing stops at the first malformed line, and nothing after it is
+      returned until the file changes.
+    - A trailing line without its newline may still be mid-write. It is
+      returned as pending if it parses, and read again next time.
+
+    A different path or inode, a shrunk file, a same-size rewrite, or any
+    change to a file that stopped at a bad line starts over from the top.
+    """
+
+    def __init__(self):
+        self._state = None
+
+    def read(self, path):
+        """Return (reset, entries, pending) for the bytes added since last read.
+
+        reset means anything built from earlier reads must be dropped first.
+        entries are the newly committed records; pending is the parsed
+        unterminated last record, or None.
+        """
+        try:
+            st = path.stat()
+        except OSError:
+            self._state = None
+            return True, [], None
+
+        state = self._state
+        reset = (state is None or state['path'] != str(path)
+                 or state['ino'] != st.st_ino or st.st_size < state['off']
+                 or (st.st_size == state['off'] and st.st_mtime_ns != state['mtime'])
+                 or (state['stopped'] and (st.st_size != state['size']
+                                           or st.st_mtime_ns != state['mtime'])))
+        if reset:
+            state = {'path': str(path), 'ino': st.st_ino, 'off': 0}
+        elif st.st_size == state['off'] or state['stopped']:
+            return False, [], None  # Nothing appended since the last read
+
+        try:
+            with open(path, 'rb') as f:
+                f.seek(state['off'])
+                data = f.read()
+        except OSError:
+            self._state = None
+            return True, [], None
+
+        entries = []
+        stopped = False
+        end = data.rfind(b'\n') + 1
+        pos = 0
+        while pos < end:
+            nl = data.index(b'\n', pos) + 1
+            line = data[pos:nl]
+            if not line.isspace():
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    stopped = True
+                    break
+            pos = nl
+
+        pending = None
+        rest = data[end:]
+        if not stopped and rest and not rest.isspace():
+            try:
+                pending = json.loads(rest)
+            except ValueError:
+                pass
+
+        state['off'] += pos
+        state['size'] = st.st_size
+        state['mtime'] = st.st_mtime_ns
+        state['stopped'] = stopped
+        self._state = state
+        return reset, entries, pending
 
 
 # ---------------------------------------------------------------------------
@@ -535,6 +917,12 @@ class AuditHistoryTab:
         self.app = app
         self.frame = ttk.Frame(notebook)
         self.runs = []
+        # Display values derived once per run, parallel to self.runs
+        self.rates = []
+        self.rows = []
+        # Parsed history owned by load(); apply() gets copies of these
+        self._loaded = ([], [], [])
+        self._history = HistoryTail()  # read position in audit_history.jsonl
 
         # Trend display
         trend_frame = ttk.LabelFrame(self.frame, text='Audit Accuracy Trend')
@@ -551,15 +939,16 @@ class AuditHistoryTab:
         # Trend bar chart (Canvas)
         self.canvas = tk.Canvas(trend_frame, height=120, background='#f8f9fa')
         self.canvas.pack(fill='x', padx=8, pady=(0, 8))
+        # Redraw on resize, coalescing the burst of <Configure> events
+        self._resize_job = None
+        # (bar, percent label, run label) canvas ids, reused across redraws
+        self._bar_items = []
+        self.canvas.bind('<Configure>', self._schedule_redraw)
 
         # Run details table
         table_frame = ttk.LabelFrame(self.frame, text='Run Details')
         table_frame.pack(fill='both', expand=True, padx=8, pady=(4, 8))
 
-        cols = ('run', 'date', 'rate', 'weighted', 'files', 'tools',
-                'quotes', 'topics', 'turns', 'functions')
-        self.tree = ttk.Treeview(table_frame, columns=cols, show='headings', height=12)
-
         col_config = [
             ('run', 'Run', 45), ('date', 'Date', 90), ('rate', 'Rate', 60),
             ('weighted', 'Weighted', 75), ('files', 'Files', 55),
@@ -567,14 +956,10 @@ class AuditHistoryTab:
             ('topics', 'Topics', 60), ('turns', 'Turns', 55),
             ('functions', 'Funcs', 55),
         ]
-        for col_id, heading, width in col_config:
-            self.tree.heading(col_id, text=heading)
-            self.tree.column(col_id, width=width, anchor='center')
-
-        tree_sb = ttk.Scrollbar(table_frame, orient='vertical', command=self.tree.yview)
-        self.tree.configure(yscrollcommand=tree_sb.set)
-        tree_sb.pack(side='right', fill='y')
-        self.tree.pack(fill='both', expand=True)
+        self.table = VirtualTreeview(table_frame, col_config, height=12,
+                                     anchor='center', on_select=self._on_select)
+        self.table.scrollbar.pack(side='right', fill='y')
+        self.table.tree.pack(fill='both', expand=True)
 
         # Detail panel
         self.detail_var = tk.StringVar()
@@ -582,31 +967,28 @@ class AuditHistoryTab:
                   font=('Consolas', 9), wraplength=900,
                   justify='left').pack(anchor='w', padx=8, pady=(0, 4))
 
-        self.tree.bind('<<TreeviewSelect>>', self._on_select)
-
     def refresh(self):
-        history_path = self.app.project_path / 'context_archive' / 'audit_history.jsonl'
-        self.runs = []
-        if history_path.exists():
-            try:
-                with open(history_path, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line:
-                            self.runs.append(json.loads(line))
-            except (json.JSONDecodeError, OSError):
-                pass
+        self.apply(self.load(self.app.project_path))
+
+    def load(self, project_path):
+        """Read new history entries. Runs on a worker thread: no widget access."""
+        history_path = project_path / 'context_archive' / 'audit_history.jsonl'
+        reset, entries, pending = self._history.read(history_path)
+        if reset:
+            self._loaded = ([], [], [])
+        for run in entries:
+            self._add_run(self._loaded, run)
+        loaded = tuple(list(values) for values in self._loaded)
+        if pending is not None:
+            self._add_run(loaded, pending)
+        return loaded
+
+    def apply(self, data):
+        """Show the result of load() in the trend chart and table."""
+        self.runs, self.rates, self.rows = data
 
         # Update trend line
-        rates = []
-        for run in self.runs:
-            summary = run.get('summary', {})
-            rate = summary.get('rate', 0)
-            if isinstance(rate, (int, float)):
-                rates.append(round(rate * 100) if rate <= 1 else round(rate))
-            else:
-                rates.append(0)
-
+        rates = self.rates
         if rates:
             trend_str = ' \u2192 '.join(f'{r}%' for r in rates)
             self.trend_var.set(trend_str)
@@ -617,39 +999,69 @@ class AuditHistoryTab:
         self._draw_bars(rates)
 
         # Populate table
-        self.tree.delete(*self.tree.get_children())
-        for run in self.runs:
-            rn = run.get('run_number', '?')
-            ts = run.get('timestamp', '')[:10]
-            summary = run.get('summary', {})
-            rate_val = summary.get('rate', 0)
-            rate_pct = f'{rate_val*100:.0f}%' if isinstance(rate_val, float) and rate_val <= 1 else f'{rate_val}%'
-            weighted = summary.get('severity_weighted_rate', '')
-            if isinstance(weighted, float):
-                weighted = f'{weighted*100:.0f}%'
-
-            cats = run.get('categories', {})
-
-            def cat_rate(name):
-                c = cats.get(name, {})
-                t = c.get('total', 0)
-                if t == 0:
-                    return 'n/a'
-                return f'{c.get("found", 0)}/{t}'
-
-            self.tree.insert('', 'end', values=(
-                rn, ts, rate_pct, weighted,
-                cat_rate('File Paths'), cat_rate('Tools Used'),
-                cat_rate('User Quotes'), cat_rate('Topics'),
-                cat_rate('Turn Counts'), cat_rate('Functions/Classes'),
-            ))
+        self.table.set_rows(self.rows)
+
+    @staticmethod
+    def _add_run(loaded, run):
+        """Append a parsed run along with its trend rate and table row."""
+        summary = run.get('summary', {})
+        rate = summary.get('rate', 0)
+        if isinstance(rate, (int, float)):
+            rate_int = round(rate * 100) if rate <= 1 else round(rate)
+        else:
+            rate_int = 0
+
+        rate_pct = f'{rate*100:.0f}%' if isinstance(rate, float) and rate <= 1 else f'{rate}%'
+        weighted = summary.get('severity_weighted_rate', '')
+        if isinstance(weighted, float):
+            weighted = f'{weighted*100:.0f}%'
+
+        cats = run.get('categories', {})
+
+        def cat_rate(name):
+            c = cats.get(name, {})
+            t = c.get('total', 0)
+            if t == 0:
+                return 'n/a'
+            return f'{c.get("found", 0)}/{t}'
+
+        runs, rates, rows = loaded
+        runs.append(run)
+        rates.append(rate_int)
+        rows.append((
+            str(run.get('run_number', '?')), run.get('timestamp', '')[:10],
+            rate_pct, str(weighted),
+            cat_rate('File Paths'), cat_rate('Tools Used'),
+            cat_rate('User Quotes'), cat_rate('Topics'),
+            cat_rate('Turn Counts'), cat_rate('Functions/Classes'),
+        ))
+
+    def _schedule_redraw(self, _event):
+        if self._resize_job is not None:
+            self.frame.after_cancel(self._resize_job)
+        self._resize_job = self.frame.after(50, self._redraw_bars)
+
+    def _redraw_bars(self):
+        self._resize_job = None
+        self._draw_bars(self.rates)
 
     def _draw_bars(self, rates):
-        self.canvas.delete('all')
+        canvas = self.canvas
+        items = self._bar_items
+        # Create or delete items only when the number of bars changes
+        while len(items) > len(rates):
+            canvas.delete(*items.pop())
+        while len(items) < len(rates):
+            items.append((
+                canvas.create_rectangle(0, 0, 0, 0, outline=''),
+                canvas.create_text(0, 0, font=('Consolas', 8), fill='#2c3e50'),
+                canvas.create_text(0, 0, text=f'R{len(items) + 1}',
+                                   font=('Consolas', 7), fill='#7f8c8d'),
+            ))
         if not rates:
             return
 
-        w = self.canvas.winfo_width() or 800
+        w = canvas.winfo_width() or 800
         h = 120
         n = len(rates)
         bar_w = max(20, min(60, (w - 40) // n))
@@ -670,19 +1082,14 @@ class AuditHistoryTab:
             else:
                 color = '#e74c3c'
 
-            self.canvas.create_rectangle(x, y_top, x + bar_w, h - 15,
-                                         fill=color, outline='')
-            self.canvas.create_text(x + bar_w // 2, h - 5, text=f'{rate}%',
-                                    font=('Consolas', 8), fill='#2c3e50')
-            self.canvas.create_text(x + bar_w // 2, y_top - 8,
-                                    text=f'R{i+1}', font=('Consolas', 7),
-                                    fill='#7f8c8d')
+            rect, pct, label = items[i]
+            canvas.coords(rect, x, y_top, x + bar_w, h - 15)
+            canvas.itemconfigure(rect, fill=color)
+            canvas.coords(pct, x + bar_w // 2, h - 5)
+            canvas.itemconfigure(pct, text=f'{rate}%')
+            canvas.coords(label, x + bar_w // 2, y_top - 8)
 
-    def _on_select(self, _event):
-        sel = self.tree.selection()
-        if not sel:
-            return
-        idx = self.tree.index(sel[0])
+    def _on_select(self, idx):
         if idx < len(self.runs):
             run = self.runs[idx]
             summary = run.get('summary', {})
@@ -696,24 +1103,20 @@ class AuditHistoryTab:
     def _export_report(self):
         if not self.runs:
             return
-        lines = ['Audit History Report', '=' * 60, '',
-                 f'Trend: {self.trend_var.get()}', '']
-
         # Table header
         header = f'{"Run":>5} {"Date":>12} {"Rate":>7} {"Weighted":>9} ' \
                  f'{"Files":>7} {"Tools":>7} {"Quotes":>8} ' \
                  f'{"Topics":>8} {"Turns":>7} {"Funcs":>7}'
-        lines.append(header)
-        lines.append('-' * len(header))
-
-        for item_id in self.tree.get_children():
-            vals = self.tree.item(item_id, 'values')
-            lines.append(f'{vals[0]:>5} {vals[1]:>12} {vals[2]:>7} {vals[3]:>9} '
-                         f'{vals[4]:>7} {vals[5]:>7} {vals[6]:>8} '
-                         f'{vals[7]:>8} {vals[8]:>7} {vals[9]:>7}')
+        lines = itertools.chain(
+            (f'Audit History Report\n{"=" * 60}\n\nTrend: {self.trend_var.get()}\n\n',
+             f'{header}\n{"-" * len(header)}\n'),
+            (f'{vals[0]:>5} {vals[1]:>12} {vals[2]:>7} {vals[3]:>9} '
+             f'{vals[4]:>7} {vals[5]:>7} {vals[6]:>8} '
+             f'{vals[7]:>8} {vals[8]:>7} {vals[9]:>7}\n' for vals in self.rows),
+        )
 
         try:
-            path = self.app.export_file('audit_report', '\n'.join(lines))
+            path = self.app.export_lines('audit_report', lines)
             self.detail_var.set(f'Exported: {path.name}')
         except OSError as e:
             messagebox.showerror('Export Error', str(e))
@@ -723,6 +1126,46 @@ class AuditHistoryTab:
 # Archive tab
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=8192)
+def parse_archive_filename(name):
+    """Extract metadata from archive filename.
+
+    Cached by name since archive filenames never change; callers must not
+    mutate the returned dict.
+    """
+    m = ARCHIVE_NAME_RE.match(name)
+    if m:
+        date, session_id, tags, v = m.groups()
+        if v is None:
+            version = 'base'
+        else:
+            version = f'enriched{v}' if v else 'enriched'
+        return {'date': date, 'session_id': session_id,
+                'tags': tags or '', 'version': version}
+
+    info = {'date': '', 'session_id': '', 'tags': '', 'version': 'base'}
+
+    # Detect enrichment version
+    if '.enriched' in name:
+        m = ENRICHED_RE.search(name)
+        if m:
+            v = m.group(1)
+            info['version'] = f'enriched{v}' if v else 'enriched'
+
+    # Parse session_DATE_ID~TAGS.ext pattern
+    m = SESSION_PREFIX_RE.match(name)
+    if m:
+        info['date'] = m.group(1)
+        info['session_id'] = m.group(2)[:8]
+
+    # Tags after ~, up to the next dot
+    _, tilde, after = name.partition('~')
+    if tilde:
+        info['tags'] = after.partition('.')[0]
+
+    return info
+
+
 class ArchiveTab:
     """Browse context_archive/ files with metadata."""
 
@@ -739,100 +1182,80 @@ class ArchiveTab:
                    command=self._export_listing).pack(side='right')
 
         # File table
-        cols = ('filename', 'date', 'session_id', 'tags', 'version')
-        self.tree = ttk.Treeview(self.frame, columns=cols, show='headings', height=20)
-
         col_config = [
             ('filename', 'Filename', 420), ('date', 'Date', 90),
             ('session_id', 'Session ID', 100), ('tags', 'Semantic Tags', 180),
             ('version', 'Version', 80),
         ]
-        for col_id, heading, width in col_config:
-            self.tree.heading(col_id, text=heading)
-            self.tree.column(col_id, width=width)
-
-        tree_sb = ttk.Scrollbar(self.frame, orient='vertical', command=self.tree.yview)
-        self.tree.configure(yscrollcommand=tree_sb.set)
-        tree_sb.pack(side='right', fill='y')
-        self.tree.pack(fill='both', expand=True, padx=8, pady=(4, 8))
+        self.table = VirtualTreeview(self.frame, col_config, height=20)
+        self.table.scrollbar.pack(side='right', fill='y')
+        self.table.tree.pack(fill='both', expand=True, padx=8, pady=(4, 8))
 
-        self.tree.bind('<Double-1>', self._on_double_click)
-        self.files = []
+        self.table.tree.bind('<Double-1>', self._on_double_click)
+        self.files = []  # path strings
+        self.rows = []  # table values, parallel to self.files
 
     def refresh(self):
-        archive_dir = self.app.project_path / 'context_archive'
-        self.tree.delete(*self.tree.get_children())
-        self.files = []
+        self.apply(self.load(self.app.project_path))
 
-        if not archive_dir.is_dir():
-            self.count_var.set('No context_archive/ found')
-            return
+    def load(self, project_path):
+        """List archive files. Runs on a worker thread: no widget access.
 
-        md_files = sorted(archive_dir.glob('*.md'), reverse=True)
-        self.count_var.set(f'{len(md_files)} archive files')
-
-        for fp in md_files:
-            name = fp.name
-            info = self._parse_filename(name)
-            self.tree.insert('', 'end', values=(
+        Returns (files, rows), or None if there is no context_archive/.
+        """
+        archive_dir = project_path / 'context_archive'
+        if not archive_dir.is_dir():
+            return None
+
+        # scandir yields names without building a Path (and stat) per entry
+        with os.scandir(archive_dir) as it:
+            md_files = [(entry.name, entry.path) for entry in it
+                        if entry.name.endswith('.md')]
+        md_files.sort(reverse=True)
+
+        files = []
+        rows = []
+        for name, path in md_files:
+            info = parse_archive_filename(name)
+            rows.append((
                 name, info['date'], info['session_id'],
                 info['tags'], info['version'],
             ))
-            self.files.append(fp)
-
-    def _parse_filename(self, name):
-        """Extract metadata from archive filename."""
-        info = {'date': '', 'session_id': '', 'tags': '', 'version': 'base'}
-
-        # Detect enrichment version
-        if '.enriched' in name:
-            m = re.search(r'\.enriched(\d*)\.md', name)
-            if m:
-                v = m.group(1)
-                info['version'] = f'enriched{v}' if v else 'enriched'
-        elif name.endswith('.md'):
-            info['version'] = 'base'
-
-        # Parse session_DATE_ID~TAGS.ext pattern
-        m = re.match(r'session_(\d{4}-\d{2}-\d{2})_([a-f0-9]+)', name)
-        if m:
-            info['date'] = m.group(1)
-            info['session_id'] = m.group(2)[:8]
-
-        # Tags after ~
-        tilde_idx = name.find('~')
-        if tilde_idx >= 0:
-            dot_idx = name.find('.', tilde_idx)
-            if dot_idx >= 0:
-                info['tags'] = name[tilde_idx + 1:dot_idx]
-            else:
-                info['tags'] = name[tilde_idx + 1:]
-
-        return info
+            files.append(path)
+        return files, rows
+
+    def apply(self, data):
+        """Show the result of load() in the table."""
+        if data is None:
+            self.files = []
+            self.rows = []
+            self.count_var.set('No context_archive/ found')
+        else:
+            self.files, self.rows = data
+            self.count_var.set(f'{len(self.files)} archive files')
+        self.table.set_rows(self.rows)
 
     def _on_double_click(self, _event):
-        sel = self.tree.selection()
-        if not sel:
+        idx = self.table.selected_index()
+        if idx is None:
             return
-        idx = self.tree.index(sel[0])
         if idx < len(self.files):
             fp = self.files[idx]
             if sys.platform == 'win32':
-                os.startfile(str(fp))
+                os.startfile(fp)
             else:
-                subprocess.Popen(['xdg-open', str(fp)])
+                subprocess.Popen(['xdg-open', fp])
 
     def _export_listing(self):
-        children = self.tree.get_children()
-        if not children:
+        if not self.rows:
             return
-        lines = ['Filename\tDate\tSession ID\tSemantic Tags\tVersion']
-        for item_id in children:
-            vals = self.tree.item(item_id, 'values')
-            lines.append('\t'.join(str(v) for v in vals))
+        lines = itertools.chain(
+            ('Filename\tDate\tSession ID\tSemantic Tags\tVersion\n',),
+            ('\t'.join(vals) + '\n' for vals in self.rows),
+        )
         try:
-            path = self.app.export_file('archive_listing', '\n'.join(lines))
-            self.count_var.set(f'{len(children)} archive files — exported: {path.name}')
+            path = self.app.export_lines('archive_listing', lines)
+            self.count_var.set(f'{len(self.rows)} archive files — exported: {path.name}')
         except OSError as e:
             messagebox.showerror('Export Error', str(e))
 
@@ -841,6 +1264,11 @@ class ArchiveTab:
 # Report Viewer tab
 # ---------------------------------------------------------------------------
 
+def to_percent(v):
+    """Scale a 0-1 float rate to 0-100; other values pass through."""
+    return v * 100 if type(v) is float and v <= 1 else v
+
+
 class ReportViewerTab:
     """Interactive viewer for compaction audit reports (bundled JSON + history)."""
 
@@ -848,6 +1276,11 @@ class ReportViewerTab:
         self.app = app
         self.frame = ttk.Frame(notebook)
         self.reports = []  # list of (path_or_None, data_dict)
+        self._history = HistoryTail()  # read position in audit_history.jsonl
+        self._history_entries = []  # legacy (run_number, report) pairs read so far
+        self._segments = []  # pending detail text, see _render_report
+        self._detail_text = ''  # plain text of the rendered report, for export
+        self._rendered = None  # report dict currently shown in the detail view
 
         # Top controls
         top = ttk.Frame(self.frame)
@@ -860,7 +1293,7 @@ class ReportViewerTab:
         ttk.Button(top, text='Open JSON',
                    command=self._open_json).pack(side='right', padx=(4, 0))
         ttk.Button(top, text='Refresh',
-                   command=self.refresh).pack(side='right')
+                   command=lambda: self.app.refresh_tab(self)).pack(side='right')
 
         # PanedWindow: list (left) + detail (right)
         self.paned = ttk.PanedWindow(self.frame, orient='horizontal')
@@ -868,21 +1301,21 @@ class ReportViewerTab:
 
         # Left panel: report list
         left = ttk.Frame(self.paned)
-        cols = ('date', 'rate', 'weighted', 'session')
-        self.tree = ttk.Treeview(left, columns=cols, show='headings', height=20)
-        for col_id, heading, width in [
+        col_config = [
             ('date', 'Date', 130), ('rate', 'Rate', 60),
             ('weighted', 'Weighted', 75), ('session', 'Session ID', 100),
-        ]:
-            self.tree.heading(col_id, text=heading)
-            self.tree.column(col_id, width=width)
-
-        tree_sb = ttk.Scrollbar(left, orient='vertical', command=self.tree.yview)
-        self.tree.configure(yscrollcommand=tree_sb.set)
-        tree_sb.pack(side='right', fill='y')
-        self.tree.pack(fill='both', expand=True)
-        self.tree.bind('<<TreeviewSelect>>', self._on_select)
+        ]
+        self.table = VirtualTreeview(left, col_config, height=20,
+                                     on_select=self._on_select)
+        self.table.scrollbar.pack(side='right', fill='y')
+        self.table.tree.pack(fill='both', expand=True)
         self.paned.add(left, weight=1)
+        self.rows = []  # table values, parallel to self.reports
+
+        # Row colors by accuracy
+        self.table.tree.tag_configure('good', foreground='#4ec9b0')
+        self.table.tree.tag_configure('warn', foreground='#dcdcaa')
+        self.table.tree.tag_configure('bad', foreground='#f44747')
 
         # Right panel: report detail viewer
         right = ttk.Frame(self.paned)
@@ -916,62 +1349,47 @@ class ReportViewerTab:
                                   font=('Consolas', 10, 'bold'))
 
     def refresh(self):
-        self.tree.delete(*self.tree.get_children())
-        self.reports = []
+        self.apply(self.load(self.app.project_path))
+
+    def load(self, project_path):
+        """Read reports from disk. Runs on a worker thread: no widget access."""
+        reports = []
+        rows = []
+        row_tags = []
 
-        reports_dir = self.app.project_path / 'context_archive' / 'compaction_reports'
-        history_path = self.app.project_path / 'context_archive' / 'audit_history.jsonl'
+        reports_dir = project_path / 'context_archive' / 'compaction_reports'
+        history_path = project_path / 'context_archive' / 'audit_history.jsonl'
 
-        # Load bundled reports
+        # Load bundled reports (newest filename first; reads run in parallel)
         bundled_runs = set()
         if reports_dir.is_dir():
-            for fp in sorted(reports_dir.glob('compaction_report_*.json'), reverse=True):
-                try:
-                    with open(fp, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    data['_source_path'] = str(fp)
-                    self.reports.append(data)
+            with os.scandir(reports_dir) as it:
+                paths = sorted((entry.path for entry in it
+                                if entry.name.startswith('compaction_report_')
+                                and entry.name.endswith('.json')), reverse=True)
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                for data in pool.map(self._read_report, paths):
+                    if data is None:
+                        continue
+                    reports.append(data)
                     rn = data.get('run_number')
                     if rn:
                         bundled_runs.add(rn)
-                except (json.JSONDecodeError, OSError):
-                    pass
 
         # Fallback: load from audit_history.jsonl for pre-bundler runs
-        if history_path.exists():
-            try:
-                with open(history_path, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        entry = json.loads(line)
-                        rn = entry.get('run_number', entry.get('run'))
-                        if rn and rn not in bundled_runs:
-                            # Build a simplified report-like dict from history
-                            data = {
-                                'report_version': 0,  # indicates legacy
-                                'timestamp': entry.get('timestamp', ''),
-                                'session_id': entry.get('session_id', '?'),
-                                'run_number': rn,
-                                'audit': {
-                                    'rate': entry.get('summary', {}).get('rate', 0),
-                                    'severity_weighted_rate': entry.get('summary', {}).get('severity_weighted_rate', 0),
-                                    'categories': entry.get('categories', {}),
-                                    'claims': entry.get('claims', []),
-                                },
-                                '_source_path': None,
-                                '_legacy': True,
-                            }
-                            self.reports.append(data)
-            except (json.JSONDecodeError, OSError):
-                pass
+        if not self._history_bundled(history_path, bundled_runs):
+            for rn, data in self._load_history_reports(history_path):
+                if rn not in bundled_runs:
+                    reports.append(data)
 
         # Sort newest first (by run number descending)
-        self.reports.sort(key=lambda d: d.get('run_number', 0), reverse=True)
+        reports.sort(key=lambda d: d.get('run_number', 0), reverse=True)
 
-        # Populate treeview
-        for data in self.reports:
+        # Build table rows, counting bundled reports on the way
+        bundled = 0
+        for data in reports:
+            if not data.get('_legacy'):
+                bundled += 1
             ts = data.get('timestamp', '')[:16]  # YYYY-MM-DDTHH:MM
             audit = data.get('audit', {})
             rate = audit.get('rate', 0)
@@ -983,48 +1401,129 @@ class ReportViewerTab:
                 weighted = f'{weighted}%'
             sid = data.get('session_id', '?')[:8]
 
-            iid = self.tree.insert('', 'end', values=(ts, rate_pct, weighted, sid))
-
             # Row coloring by accuracy
-            rate_num = rate * 100 if isinstance(rate, float) and rate <= 1 else rate
+            rate_num = to_percent(rate)
             if rate_num >= 80:
-                self.tree.item(iid, tags=('good',))
+                tag = 'good'
             elif rate_num >= 60:
-                self.tree.item(iid, tags=('warn',))
+                tag = 'warn'
             else:
-                self.tree.item(iid, tags=('bad',))
+                tag = 'bad'
+            rows.append((ts, rate_pct, weighted, sid))
+            row_tags.append((tag,))
 
-        self.tree.tag_configure('good', foreground='#4ec9b0')
-        self.tree.tag_configure('warn', foreground='#dcdcaa')
-        self.tree.tag_configure('bad', foreground='#f44747')
+        return reports, rows, row_tags, bundled
+
+    def apply(self, data):
+        """Show the result of load() in the table."""
+        self.reports, self.rows, row_tags, bundled = data
+
+        self.table.set_rows(self.rows, row_tags)
 
         total = len(self.reports)
-        bundled = len([r for r in self.reports if not r.get('_legacy')])
         if total == 0:
             self.count_var.set('No reports yet — reports are created on compaction')
         else:
             self.count_var.set(f'{total} reports ({bundled} bundled, {total - bundled} legacy)')
 
-    def _on_select(self, _event):
-        sel = self.tree.selection()
-        if not sel:
-            return
-        idx = self.tree.index(sel[0])
+    @staticmethod
+    def _read_report(path):
+        """Load one bundled report JSON, or None if unreadable. Thread-safe."""
+        try:
+            with open(path, 'rb') as f:
+                data = json.loads(f.read())
+        except (json.JSONDecodeError, OSError):
+            return None
+        data['_source_path'] = path
+        cs = data.get('compaction_summary')
+        if isinstance(cs, dict):
+            text = cs.get('text')
+            if isinstance(text, str) and len(text) > SUMMARY_PREVIEW_CHARS:
+                cs['text'] = text[:SUMMARY_PREVIEW_CHARS]
+                cs['text_total_len'] = len(text)
+        return data
+
+    @staticmethod
+    def _history_bundled(history_path, bundled_runs):
+        """True if every audit_history.jsonl run already has a bundled report.
+
+        Autoarchive numbers each appended run len(history) + 1, so no run
+        number in the file exceeds its count of non-blank lines. Counting
+        those is enough to rule out legacy entries without parsing any JSON.
+        An unterminated last line still counts: over-counting only costs a
+        fallback read, while under-counting would hide a legacy run.
+        """
+        if not bundled_runs:
+            return False
+        try:
+            with open(history_path, 'rb') as f:
+                raw = f.read()
+        except OSError:
+            return True  # no history file, so nothing to fall back to
+        runs = sum(1 for line in raw.split(b'\n') if line.strip())
+        return all(rn in bundled_runs for rn in range(1, runs + 1))
+
+    def _load_history_reports(self, history_path):
+        """Return (run_number, legacy report dict) for audit_history.jsonl entries.
+
+        Parsed entries are kept between refreshes; HistoryTail reads only what
+        was appended since, under the same rules as the Audit History tab.
+        """
+        reset, entries, pending = self._history.read(history_path)
+        if reset:
+            self._history_entries = []
+        for entry in entries:
+            self._add_history_entry(self._history_entries, entry)
+        if pending is None:
+            return self._history_entries
+        # The unterminated last run is shown but not kept
+        with_pending = list(self._history_entries)
+        self._add_history_entry(with_pending, pending)
+        return with_pending
+
+    @staticmethod
+    def _add_history_entry(entries, entry):
+        rn = entry.get('run_number', entry.get('run'))
+        if rn:
+            summary = entry.get('summary', {})
+            # Build a simplified report-like dict from history
+            entries.append((rn, {
+                'report_version': 0,  # indicates legacy
+                'timestamp': entry.get('timestamp', ''),
+                'session_id': entry.get('session_id', '?'),
+                'run_number': rn,
+                'audit': {
+                    'rate': summary.get('rate', 0),
+                    'severity_weighted_rate': summary.get('severity_weighted_rate', 0),
+                    'categories': entry.get('categories', {}),
+                    'claims': entry.get('claims', []),
+                },
+                '_source_path': None,
+                '_legacy': True,
+            }))
+
+    def _on_select(self, idx):
         if idx < len(self.reports):
             self._render_report(self.reports[idx])
 
     def _render_report(self, data):
-        self.detail.configure(state='normal')
-        self.detail.delete('1.0', 'end')
+        # Reselecting the report already shown (e.g. after a refresh that
+        # reused the cached legacy entries) leaves the widget untouched
+        if data is self._rendered:
+            return
+        self._rendered = data
+
+        # _ins collects (text, tags) segments; they go to Tk in one call
+        self._segments = []
 
         run = data.get('run_number', '?')
         ts = data.get('timestamp', '?')
         sid = data.get('session_id', '?')
         audit = data.get('audit', {})
         rate = audit.get('rate', 0)
-        rate_pct = rate * 100 if isinstance(rate, float) and rate <= 1 else rate
+        rate_pct = to_percent(rate)
         weighted = audit.get('severity_weighted_rate', 0)
-        weighted_pct = weighted * 100 if isinstance(weighted, float) and weighted <= 1 else weighted
+        weighted_pct = to_percent(weighted)
 
         # 1. Header
         self._ins(f'  COMPACTION AUDIT REPORT  —  Run #{run}\n', 'header')
@@ -1086,10 +1585,12 @@ class ReportViewerTab:
             self._ins(f'  Timestamp: {cs.get("compaction_timestamp", "?")}\n\n', 'dim')
             text = cs.get('text', '')
             if text:
-                # Show first 2000 chars with distinct background
-                preview = text[:2000]
-                if len(text) > 2000:
-                    preview += f'\n... ({len(text) - 2000} more chars)'
+                # Show the preview with distinct background; _read_report has
+                # usually truncated it already and recorded the full length
+                preview = text[:SUMMARY_PREVIEW_CHARS]
+                total = cs.get('text_total_len', len(text))
+                if total > SUMMARY_PREVIEW_CHARS:
+                    preview += f'\n... ({total - SUMMARY_PREVIEW_CHARS} more chars)'
                 self._ins(preview + '\n\n', 'summary_bg')
 
         # 6. Audit Results by Category
@@ -1099,9 +1600,7 @@ class ReportViewerTab:
             self._ins('  AUDIT RESULTS BY CATEGORY\n', 'subheader')
             self._ins('  ' + '-' * 50 + '\n', 'separator')
             for cat_name, cat_data in categories.items():
-                cat_rate = cat_data.get('rate', 0)
-                if isinstance(cat_rate, float) and cat_rate <= 1:
-                    cat_rate = cat_rate * 100
+                cat_rate = to_percent(cat_data.get('rate', 0))
                 found = cat_data.get('found', 0)
                 total = cat_data.get('total', 0)
                 self._ins(f'  {cat_name}: {cat_rate:.0f}% ({found}/{total})\n', 'subheader')
@@ -1130,12 +1629,15 @@ class ReportViewerTab:
             self._ins('  CROSS-REFERENCE\n', 'subheader')
             gt_topics = gt.get('topics', '')
             if gt_topics:
-                topic_claims = [c.get('claim', '') for c in claims
-                                if c.get('category') == 'Topics']
+                # One lowercase haystack of all topic claims; the NUL
+                # separator keeps a topic from matching across two claims
+                haystack = '\0'.join(c.get('claim', '').lower() for c in claims
+                                      if c.get('category') == 'Topics')
                 gt_list = [t.strip() for t in gt_topics.split(',') if t.strip()]
-                matched = [t for t in gt_list if any(t.lower() in tc.lower()
-                           for tc in topic_claims)]
-                unmatched = [t for t in gt_list if t not in matched]
+                matched = []
+                unmatched = []
+                for t in gt_list:
+                    (matched if t.lower() in haystack else unmatched).append(t)
                 if matched:
                     self._ins(f'  Topics in both ground truth and audit: {len(matched)}\n', 'info')
                 if unmatched:
@@ -1149,22 +1651,23 @@ class ReportViewerTab:
             self._ins('  (Legacy report — loaded from audit_history.jsonl, '
                       'no bundled data available)\n', 'dim')
 
+        self.detail.configure(state='normal')
+        self.detail.replace('1.0', 'end', *self._segments)
         self.detail.configure(state='disabled')
         self.detail.see('1.0')
+        self._detail_text = ''.join(self._segments[::2])
+        self._segments = []
 
     def _ins(self, text, tag=''):
-        """Insert text with optional tag into detail viewer."""
-        if tag:
-            self.detail.insert('end', text, tag)
-        else:
-            self.detail.insert('end', text)
+        """Queue text with optional tag for the detail viewer."""
+        self._segments.append(text)
+        self._segments.append(tag or ())
 
     def _open_json(self):
-        sel = self.tree.selection()
-        if not sel:
+        idx = self.table.selected_index()
+        if idx is None:
             messagebox.showinfo('No Selection', 'Select a report first.')
             return
-        idx = self.tree.index(sel[0])
         if idx < len(self.reports):
             path = self.reports[idx].get('_source_path')
             if path:
@@ -1179,7 +1682,7 @@ class ReportViewerTab:
 
     def _export_report(self):
         """Export the currently displayed report as a text file."""
-        content = self.detail.get('1.0', 'end').strip()
+        content = self._detail_text.strip()
         if not content:
             return
         try:
@@ -1216,6 +1719,14 @@ class BCPDashboard:
         self.root.geometry(geo)
 
         self.semantic_map = {}
+        self._save_job = None
+        # Background tab loading: tab.load() runs on the executor, finished
+        # futures are handed back through _io_done and applied by _drain_io
+        self._io_executor = ThreadPoolExecutor(max_workers=4)
+        self._io_done = deque()
+        self._io_busy = {}  # tab -> reload requested while its load was running
+        self._io_job = None
+        self._applied_theme = None  # dark_mode value the widgets currently show
         self.log_var = tk.StringVar(value='No logs exported yet')
 
         self._build_ui()
@@ -1243,12 +1754,37 @@ class BCPDashboard:
         except OSError:
             pass
 
+    def schedule_save_semantic_map(self, delay_ms=500):
+        """Save semantic_map.json after a quiet period, coalescing rapid edits."""
+        if self._save_job is not None:
+            self.root.after_cancel(self._save_job)
+        self._save_job = self.root.after(delay_ms, self.save_semantic_map)
+
     def save_semantic_map(self):
+        """Write semantic_map.json atomically (temp file + os.replace)."""
+        if self._save_job is not None:
+            self.root.after_cancel(self._save_job)
+            self._save_job = None
         map_path = TOOLS_DIR / 'semantic_map.json'
+        tmp_path = None
         try:
-            with open(map_path, 'w', encoding='utf-8') as f:
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=str(TOOLS_DIR),
+                                             prefix='.semantic_map.', suffix='.tmp',
+                                             delete=False) as f:
+                tmp_path = f.name
                 json.dump(self.semantic_map, f, indent=2, ensure_ascii=False)
+            # The temp file is created 0600; keep the existing map's mode
+            try:
+                shutil.copymode(map_path, tmp_path)
+            except FileNotFoundError:
+                pass
+            os.replace(tmp_path, map_path)
         except OSError as e:
+            if tmp_path:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
             messagebox.showerror('Save Error', f'Failed to save semantic_map.json:\n{e}')
 
     def get_log_dir(self):
@@ -1259,11 +1795,15 @@ class BCPDashboard:
 
     def export_file(self, prefix, content):
         """Write content to a timestamped file in the log dir. Returns path."""
+        return self.export_lines(prefix, (content,))
+
+    def export_lines(self, prefix, lines):
+        """Like export_file, but streams an iterable of newline-terminated strings."""
         log_dir = self.get_log_dir()
         ts = datetime.now().strftime('%Y-%m-%d_%H%M%S')
         path = log_dir / f'{prefix}_{ts}.txt'
         with open(path, 'w', encoding='utf-8') as f:
-            f.write(content)
+            f.writelines(lines)
         self.log_var.set(f'Last export: {path}')
         return path
 
@@ -1321,19 +1861,29 @@ class BCPDashboard:
         self.notebook.pack(fill='both', expand=True, padx=8, pady=(0, 8))
 
         self.tools_tab = ToolsTab(self.notebook, self)
-        self.semantic_tab = SemanticMapTab(self.notebook, self)
-        self.blacklist_tab = BlacklistTab(self.notebook, self)
         self.audit_tab = AuditHistoryTab(self.notebook, self)
-        self.archive_tab = ArchiveTab(self.notebook, self)
         self.report_tab = ReportViewerTab(self.notebook, self)
 
+        # Widget-heavy tabs are built on first visit (see _on_tab_changed);
+        # until then the notebook holds an empty placeholder frame
+        self.semantic_tab = None
+        self.blacklist_tab = None
+        self.archive_tab = None
+        self._tab_factories = {}
+
+        def lazy(attr, cls):
+            placeholder = ttk.Frame(self.notebook)
+            self._tab_factories[str(placeholder)] = (attr, cls, placeholder)
+            return placeholder
+
         # Tools first — most immediately useful
         self.notebook.add(self.tools_tab.frame, text=' Tools ')
-        self.notebook.add(self.semantic_tab.frame, text=' Semantic Map ')
-        self.notebook.add(self.blacklist_tab.frame, text=' Blacklist ')
+        self.notebook.add(lazy('semantic_tab', SemanticMapTab), text=' Semantic Map ')
+        self.notebook.add(lazy('blacklist_tab', BlacklistTab), text=' Blacklist ')
         self.notebook.add(self.audit_tab.frame, text=' Audit History ')
         self.notebook.add(self.report_tab.frame, text=' Reports ')
-        self.notebook.add(self.archive_tab.frame, text=' Archive ')
+        self.notebook.add(lazy('archive_tab', ArchiveTab), text=' Archive ')
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
 
         # Log directory indicator (bottom bar)
         log_frame = ttk.Frame(self.root)
@@ -1351,22 +1901,77 @@ class BCPDashboard:
             self._save_config()
             self._load_data()
 
+    def _built_tabs(self):
+        """Return the tabs that have been constructed so far."""
+        tabs = [self.tools_tab, self.semantic_tab, self.blacklist_tab,
+                self.audit_tab, self.report_tab, self.archive_tab]
+        return [tab for tab in tabs if tab is not None]
+
+    def _on_tab_changed(self, event=None):
+        """Build a lazily-created tab the first time it is selected."""
+        entry = self._tab_factories.pop(self.notebook.select(), None)
+        if entry is None:
+            return
+        attr, cls, placeholder = entry
+        tab = cls(placeholder, self)
+        tab.frame.pack(fill='both', expand=True)
+        setattr(self, attr, tab)
+        self._apply_tab_theme(tab)
+        self.refresh_tab(tab)
+
+    def refresh_tab(self, tab):
+        """Refresh a tab, doing its file I/O off the Tk thread when it can.
+
+        Tabs with load()/apply() are loaded on the executor and applied by
+        _drain_io. Tabs that only show in-memory data refresh directly.
+        """
+        if not hasattr(tab, 'load'):
+            tab.refresh()
+            return
+        if tab in self._io_busy:
+            self._io_busy[tab] = True  # reload once the running load finishes
+            return
+        self._io_busy[tab] = False
+        future = self._io_executor.submit(tab.load, self.project_path)
+        future.add_done_callback(lambda f: self._io_done.append((tab, f)))
+        if self._io_job is None:
+            self._io_job = self.root.after(30, self._drain_io)
+
+    def _drain_io(self):
+        self._io_job = None
+        while self._io_done:
+            tab, future = self._io_done.popleft()
+            if self._io_busy.pop(tab, False):
+                self.refresh_tab(tab)
+            try:
+                tab.apply(future.result())
+            except Exception:
+                # Report it like any Tk callback error; the other loads still apply
+                self.root.report_callback_exception(*sys.exc_info())
+        # Keep polling while loads are outstanding
+        if self._io_busy and self._io_job is None:
+            self._io_job = self.root.after(30, self._drain_io)
+
     def _load_data(self):
         self.project_path = Path(self.project_var.get())
         self._load_semantic_map_data()
-        self.semantic_tab.refresh()
-        self.blacklist_tab.refresh()
-        self.audit_tab.refresh()
-        self.report_tab.refresh()
-        self.archive_tab.refresh()
+        # Unbuilt tabs pick up the new data when first shown
+        for tab in self._built_tabs():
+            if hasattr(tab, 'refresh'):
+                self.refresh_tab(tab)
 
     def _load_semantic_map_data(self):
+        # Flush a pending debounced save so reloading doesn't discard edits
+        if self._save_job is not None:
+            self.save_semantic_map()
         map_path = TOOLS_DIR / 'semantic_map.json'
         if map_path.exists():
             try:
                 with open(map_path, 'r', encoding='utf-8') as f:
                     self.semantic_map = json.load(f)
-                    return
+                # Sort once here; BlacklistTab keeps it sorted from then on
+                self.semantic_map.setdefault('blacklist', []).sort(key=str.lower)
+                return
             except (json.JSONDecodeError, OSError):
                 pass
         self.semantic_map = {'mappings': {}, 'blacklist': []}
@@ -1423,6 +2028,8 @@ class BCPDashboard:
     def _apply_theme(self):
         """Apply light or dark theme to all widgets."""
         dark = self.config.get('dark_mode', False)
+        if dark == self._applied_theme:
+            return
 
         if dark:
             bg = '#1e1e1e'
@@ -1466,25 +2073,31 @@ class BCPDashboard:
         # Root window
         self.root.configure(bg=bg)
 
-        # Apply to each tab's owned widgets
-        for tab in [self.tools_tab, self.semantic_tab, self.blacklist_tab,
-                     self.audit_tab, self.report_tab, self.archive_tab]:
-            if hasattr(tab, '_apply_theme'):
-                tab._apply_theme(dark)
+        # Kept for tabs built later by _on_tab_changed
+        self._theme = {'dark': dark, 'bg': bg, 'fg': fg, 'bg2': bg2, 'sel_bg': sel_bg}
+        for tab in self._built_tabs():
+            self._apply_tab_theme(tab)
+        self._applied_theme = dark
+
+    def _apply_tab_theme(self, tab):
+        """Apply the current theme to one tab's owned widgets."""
+        theme = self._theme
+        dark = theme['dark']
+        if hasattr(tab, '_apply_theme'):
+            tab._apply_theme(dark)
 
         # Direct tk widgets that don't follow ttk themes
-        self._apply_tk_text_theme(self.tools_tab, 'output', dark)
-        self._apply_tk_text_theme(self.report_tab, 'detail', dark)
+        self._apply_tk_text_theme(tab, 'output', dark)
+        self._apply_tk_text_theme(tab, 'detail', dark)
 
         # Canvas widgets
-        for tab in [self.semantic_tab, self.audit_tab]:
-            if hasattr(tab, 'canvas'):
-                tab.canvas.configure(bg=bg2)
+        if hasattr(tab, 'canvas'):
+            tab.canvas.configure(bg=theme['bg2'])
 
         # Listbox widgets
-        if hasattr(self.blacklist_tab, 'listbox'):
-            self.blacklist_tab.listbox.configure(
-                bg=bg, fg=fg, selectbackground=sel_bg,
+        if hasattr(tab, 'listbox'):
+            tab.listbox.configure(
+                bg=theme['bg'], fg=theme['fg'], selectbackground=theme['sel_bg'],
                 selectforeground='#ffffff')
 
     def _apply_tk_text_theme(self, tab, attr, dark):
@@ -1499,7 +2112,10 @@ class BCPDashboard:
                                  insertbackground='#1e1e1e')
 
     def _on_close(self):
+        if self._save_job is not None:
+            self.save_semantic_map()
         self._save_config()
+        self._io_executor.shutdown(wait=False)
         self.root.destroy()
 
 
@@ -23,8 +23,11 @@ import sys
 import io
 import os
 import argparse
+import functools
+import itertools
+import mmap
+from operator import itemgetter
 from pathlib import Path
-from collections import Counter
 from datetime import datetime, timezone
 
 
@@ -50,6 +53,18 @@ SEVERITY_WEIGHT = {
     'INFO': 1,
 }
 
+
+def _category_meta(category):
+    """Return (severity, weight, claim ID prefix) for a result category."""
+    severity = CATEGORY_SEVERITY.get(category, 'INFO')
+    # Claim IDs: fp-1, fp-2, tu-1, etc.
+    return severity, SEVERITY_WEIGHT.get(severity, 1), category[:1].lower()
+
+
+# Known categories resolved once; build_structured_results falls back to
+# _category_meta for any other category name
+_CATEGORY_META = {cat: _category_meta(cat) for cat in CATEGORY_SEVERITY}
+
 # Force UTF-8 on Windows
 if sys.stdout.encoding != 'utf-8':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
@@ -63,55 +78,113 @@ if sys.stderr.encoding != 'utf-8':
 
 COMPACTION_MARKER = "This session is being continued from a previous conversation"
 
+# Byte needles locating candidate lines in find_compaction_summaries
+_COMPACT_NEEDLES = (
+    b'"isCompactSummary":true',
+    b'"isCompactSummary": true',
+    COMPACTION_MARKER.encode('utf-8'),
+)
+
+
+def _is_compaction_entry(entry):
+    """Return True if a transcript entry is a compaction summary."""
+    # Primary detection: explicit flag
+    if entry.get('isCompactSummary', False):
+        return True
+    # Fallback detection: marker text in user message
+    content = entry.get('message', {}).get('content', '')
+    return isinstance(content, str) and COMPACTION_MARKER in content[:200]
+
+
+def _compaction_entry_text(entry):
+    """Return the summary text of a compaction entry."""
+    content = entry.get('message', {}).get('content', '')
+    # Handle content-blocks format (list of dicts); a summary is usually
+    # one text block, which needs no join
+    if (isinstance(content, list) and len(content) == 1
+            and isinstance(content[0], dict)
+            and content[0].get('type') == 'text'):
+        return content[0].get('text', '')
+    if isinstance(content, list):
+        parts = []
+        for block in content:
+            if isinstance(block, dict) and block.get('type') == 'text':
+                parts.append(block.get('text', ''))
+            elif isinstance(block, str):
+                parts.append(block)
+        return '\n'.join(parts)
+    return content
+
+
+def _iter_compaction_entries(jsonl_path):
+    """Yield (offset, line, entry) for each compaction entry in a transcript."""
+    with open(jsonl_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return    # mmap refuses empty files
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Search the mapped file for the summary flag or marker text;
+            # only the lines holding a hit are sliced out, decoded and parsed
+            starts = set()
+            for needle in _COMPACT_NEEDLES:
+                pos = mm.find(needle)
+                while pos != -1:
+                    starts.add(mm.rfind(b'\n', 0, pos) + 1)
+                    end = mm.find(b'\n', pos)
+                    pos = mm.find(needle, end) if end != -1 else -1
+
+            lineno, counted = 1, 0
+            for start in sorted(starts):
+                lineno += mm[counted:start].count(b'\n')
+                counted = start
+                end = mm.find(b'\n', start)
+                raw = mm[start:end] if end != -1 else mm[start:]
+                try:
+                    entry = json.loads(raw.decode('utf-8', 'replace'))
+                except json.JSONDecodeError:
+                    continue
+                if _is_compaction_entry(entry):
+                    yield start, lineno, entry
+
 
 def find_compaction_summaries(jsonl_path):
     """Find all compaction summary messages in a .jsonl transcript.
 
     Returns list of dicts: {'text', 'timestamp', 'session_id', 'line'}
     """
-    summaries = []
-    with open(jsonl_path, 'r', encoding='utf-8') as f:
-        for lineno, line in enumerate(f, 1):
-            line = line.strip()
-            if not line:
-                continue
-            # Fast pre-check before parsing JSON
-            if 'isCompactSummary' not in line and COMPACTION_MARKER not in line:
-                continue
-            try:
-                entry = json.loads(line)
-            except json.JSONDecodeError:
-                continue
+    return [
+        {
+            'text': _compaction_entry_text(entry),
+            'timestamp': entry.get('timestamp', ''),
+            'session_id': entry.get('sessionId', ''),
+            'line': lineno,
+        }
+        for _, lineno, entry in _iter_compaction_entries(jsonl_path)
+    ]
 
-            # Primary detection: explicit flag
-            is_compact = entry.get('isCompactSummary', False)
-
-            # Fallback detection: marker text in user message
-            if not is_compact:
-                msg = entry.get('message', {})
-                content = msg.get('content', '')
-                if isinstance(content, str) and COMPACTION_MARKER in content[:200]:
-                    is_compact = True
-
-            if is_compact:
-                msg = entry.get('message', {})
-                content = msg.get('content', '')
-                # Handle content-blocks format (list of dicts)
-                if isinstance(content, list):
-                    parts = []
-                    for block in content:
-                        if isinstance(block, dict) and block.get('type') == 'text':
-                            parts.append(block.get('text', ''))
-                        elif isinstance(block, str):
-                            parts.append(block)
-                    content = '\n'.join(parts)
-                summaries.append({
-                    'text': content,
-                    'timestamp': entry.get('timestamp', ''),
-                    'session_id': entry.get('sessionId', ''),
-                    'line': lineno,
-                })
-    return summaries
+
+def find_compaction_summary_index(jsonl_path):
+    """Like find_compaction_summaries, without keeping each summary's text.
+
+    Returns list of dicts: {'timestamp', 'session_id', 'line', 'offset'};
+    pass 'offset' to read_compaction_summary for the text of the one needed.
+    """
+    return [
+        {
+            'timestamp': entry.get('timestamp', ''),
+            'session_id': entry.get('sessionId', ''),
+            'line': lineno,
+            'offset': offset,
+        }
+        for offset, lineno, entry in _iter_compaction_entries(jsonl_path)
+    ]
+
+
+def read_compaction_summary(jsonl_path, offset):
+    """Read the summary text of the compaction entry at a byte offset."""
+    with open(jsonl_path, 'rb') as f:
+        f.seek(offset)
+        entry = json.loads(f.readline().decode('utf-8', 'replace'))
+    return _compaction_entry_text(entry)
 
 
 def read_summary_file(filepath):
@@ -124,40 +197,77 @@ def read_summary_file(filepath):
 # CLAIM EXTRACTION
 # ============================================================
 
+# Precompiled once; the extract_* functions run for every summary audited
+_CODE_BLOCK_RE = re.compile(r'```[\s\S]*?```')
+_WIN_PATH_RE = re.compile(r'[A-Za-z]:[/\\][\w./\\-]+')      # Windows: C:\foo\bar.py
+_UNIX_PATH_RE = re.compile(r'(?<!\w)/(?:[\w.-]+/)+[\w.-]+')  # Unix: /foo/bar/baz.py
+_USER_MSG_RE = re.compile(r'All User Messages[:\s]*\n', re.IGNORECASE)
+_NEXT_SECTION_RE = re.compile(r'^\s*\d+\.\s+[A-Z]', re.MULTILINE)
+_SMART_Q_RE = re.compile(r'\u201c([^\u201d]{8,})\u201d')
+_STRAIGHT_Q_RE = re.compile(r'"([^"]{8,})"')
+_PATHLIKE_RE = re.compile(r'^[\w./\\:]+$')
+_MESSAGE_LABEL_RE = re.compile(r'^Message\s+\d+')
+_TOPIC_RE = re.compile(
+    r'\*\*(?P<bold>[^*]{3,50})\*\*'                       # **Bold term**
+    r'|\b(?P<phrase>[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)\b'   # Capitalized Phrase
+    r'|\b(?P<acr>[A-Z]{2,})\b'                           # ACRONYM
+)
+_PHRASE_LABEL_RE = re.compile(r'^(Message|Session|Turn|Step|Phase|Option)\s')
+_TURN_COUNT_RE = re.compile(r'(\d+)[\s-]*turns?\b', re.IGNORECASE)
+_DEF_RE = re.compile(r'\bdef\s+(\w+)\s*\(')
+_CLASS_RE = re.compile(r'\bclass\s+(\w+)')
+
+
+def _cached_claims(func):
+    """Memoize a claim extractor on the summary text.
+
+    Reruns audit the same summary repeatedly; the cached result is kept as
+    a tuple and each caller still gets its own list.
+    """
+    cached = functools.lru_cache(maxsize=16)(lambda text: tuple(func(text)))
+
+    @functools.wraps(func)
+    def wrapper(text):
+        return list(cached(text))
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
 def strip_code_blocks(text):
     """Remove fenced code blocks (```...```) to avoid false matches."""
-    return re.sub(r'```[\s\S]*?```', '', text)
+    return _CODE_BLOCK_RE.sub('', text)
 
 
+@_cached_claims
 def extract_file_claims(text):
     """Extract file paths mentioned in the compaction summary."""
-    patterns = [
-        r'[A-Za-z]:[/\\][\w./\\-]+',              # Windows: C:\foo\bar.py
-        r'(?<!\w)/(?:[\w.-]+/)+[\w.-]+',            # Unix: /foo/bar/baz.py
-    ]
     paths = set()
-    for pattern in patterns:
-        for match in re.findall(pattern, text):
+    for pattern in (_WIN_PATH_RE, _UNIX_PATH_RE):
+        for match in pattern.findall(text):
             cleaned = match.rstrip('/\\).,:;')
             if len(cleaned) > 5:
                 paths.add(cleaned)
     return sorted(paths)
 
 
+_KNOWN_TOOLS = (
+    'Read', 'Write', 'Edit', 'Bash', 'Glob', 'Grep', 'Task',
+    'TodoWrite', 'AskUserQuestion', 'ExitPlanMode', 'EnterPlanMode',
+    'WebFetch', 'WebSearch', 'NotebookEdit', 'Skill',
+)
+# One alternation instead of a search per tool; longest names first so
+# e.g. NotebookEdit is tried before Edit at the same position
+_TOOLS_RE = re.compile(r'\b(' + '|'.join(
+    re.escape(t) for t in sorted(_KNOWN_TOOLS, key=len, reverse=True)) + r')\b')
+
+
+@_cached_claims
 def extract_tool_claims(text):
     """Extract Claude Code tool names mentioned in the summary."""
-    known_tools = {
-        'Read', 'Write', 'Edit', 'Bash', 'Glob', 'Grep', 'Task',
-        'TodoWrite', 'AskUserQuestion', 'ExitPlanMode', 'EnterPlanMode',
-        'WebFetch', 'WebSearch', 'NotebookEdit', 'Skill',
-    }
-    found = set()
-    for tool in known_tools:
-        if re.search(r'\b' + re.escape(tool) + r'\b', text):
-            found.add(tool)
-    return sorted(found)
+    return sorted(set(_TOOLS_RE.findall(text)))
 
 
+@_cached_claims
 def extract_user_quotes(text):
     """Extract quoted user messages from the summary.
 
@@ -166,11 +276,11 @@ def extract_user_quotes(text):
     """
     # Try to isolate the "All User Messages" section first
     target = text
-    um_match = re.search(r'All User Messages[:\s]*\n', text, re.IGNORECASE)
+    um_match = _USER_MSG_RE.search(text)
     if um_match:
         start = um_match.end()
         # Find next numbered section header
-        next_section = re.search(r'^\s*\d+\.\s+[A-Z]', text[start:], re.MULTILINE)
+        next_section = _NEXT_SECTION_RE.search(text[start:])
         end = start + next_section.start() if next_section else len(text)
         target = text[start:end]
 
@@ -179,16 +289,16 @@ def extract_user_quotes(text):
 
     quotes = []
     # Smart quotes
-    for match in re.finditer(r'\u201c([^\u201d]{8,})\u201d', target):
+    for match in _SMART_Q_RE.finditer(target):
         quotes.append(match.group(1))
     # Straight quotes
-    for match in re.finditer(r'"([^"]{8,})"', target):
+    for match in _STRAIGHT_Q_RE.finditer(target):
         q = match.group(1)
         # Skip code-like strings
-        if q.startswith('{') or q.startswith('[') or '\\n' in q:
+        if q.startswith(('{', '[')) or '\\n' in q:
             continue
         # Skip strings that look like paths or code
-        if re.match(r'^[\w./\\:]+$', q):
+        if _PATHLIKE_RE.match(q):
             continue
         quotes.append(q)
 
@@ -203,21 +313,27 @@ def extract_user_quotes(text):
     return unique
 
 
+@functools.lru_cache(maxsize=2)
 def _load_blacklist(archive_dir=None):
-    """Load user-managed blacklist from semantic_map.json if available."""
+    """Load user-managed blacklist from semantic_map.json if available.
+
+    Cached: read once per process rather than once per audited summary.
+    """
     blacklist = set()
     # Try semantic_map.json in the tools directory (sibling to this file)
     tools_dir = Path(__file__).resolve().parent
     map_path = tools_dir / 'semantic_map.json'
     if map_path.exists():
         try:
-            with open(map_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # json.loads takes the bytes directly; ValueError also covers
+            # undecodable input alongside JSONDecodeError
+            with open(map_path, 'rb') as f:
+                data = json.loads(f.read())
             for word in data.get('blacklist', []):
                 blacklist.add(word.upper())
-        except (json.JSONDecodeError, OSError):
+        except (ValueError, OSError):
             pass
-    return blacklist
+    return frozenset(blacklist)
 
 
 def _is_formatting_artifact(text):
@@ -226,7 +342,7 @@ def _is_formatting_artifact(text):
     if '\n' in text or '\r' in text:
         return True
     # Mostly punctuation/whitespace (less than 50% alphanumeric)
-    alnum = sum(1 for c in text if c.isalnum())
+    alnum = sum(map(str.isalnum, text))
     if len(text) > 0 and alnum / len(text) < 0.5:
         return True
     # Starts with punctuation or markdown artifacts
@@ -235,6 +351,73 @@ def _is_formatting_artifact(text):
     return False
 
 
+# Section headers to skip (these are summary structure, not topic claims)
+_SECTION_HEADERS = frozenset({
+    'primary request and intent', 'key technical concepts',
+    'files and code sections', 'errors and fixes', 'problem solving',
+    'all user messages', 'pending tasks', 'current work',
+    'optional next step', 'analysis', 'summary',
+})
+
+# Status/label words to skip
+_SKIP_LABELS = frozenset({
+    'NOTE', 'CRITICAL', 'IMPORTANT', 'SOLVED', 'NOT FIXED', 'ONGOING',
+    'MODIFIED', 'CREATED', 'READ', 'GENERATED', 'BUG', 'COMPLETE',
+    'WHAT', 'WHY', 'HOW', 'FIX', 'ERROR', 'FIXED', 'DEFERRED',
+    'IN', 'ADD', 'JUST', 'ONLY', 'CHANGE',
+})
+
+# ALL-CAPS acronyms to skip (user blacklist is merged in per call)
+# Hardcoded: common English words, technical boilerplate, status labels
+_SKIP_ACR = frozenset({
+    # 2-letter
+    'OK', 'ID', 'VS', 'IE', 'EG', 'IF', 'OR', 'IS', 'IT', 'DO', 'AS',
+    'ON', 'TO', 'AT', 'OF', 'NO', 'UP', 'SO', 'BE', 'BY', 'AM', 'AN',
+    'PC', 'IN',
+    # 3-letter
+    'NOT', 'THE', 'AND', 'FOR', 'ALL', 'HAS', 'WAS', 'GET', 'SET', 'PUT',
+    'API', 'CLI', 'URL', 'SQL', 'ADD', 'BUT', 'CAN', 'DID', 'HAD', 'HER',
+    'HIS', 'HIM', 'HOW', 'ITS', 'LET', 'MAY', 'NEW', 'NOW', 'OLD', 'OUR',
+    'OWN', 'RAN', 'SAY', 'SHE', 'THE', 'TRY', 'USE', 'WAY', 'WHO', 'WIN',
+    'YET', 'ANY', 'FEW', 'GOT', 'NOR', 'RUN', 'TWO',
+    # 4-letter
+    'JSON', 'HTML', 'TEXT', 'FILE', 'PATH', 'UUID', 'NULL', 'TRUE', 'ARGS',
+    'HTTP', 'SELF', 'NONE', 'JUST', 'ONLY', 'ALSO', 'BACK', 'BEEN', 'BOTH',
+    'CALL', 'COME', 'DONE', 'EACH', 'EVEN', 'FIND', 'FROM', 'GAVE', 'GOES',
+    'GONE', 'GOOD', 'HAVE', 'HERE', 'INTO', 'KEEP', 'KNOW', 'LAST', 'LEFT',
+    'LIKE', 'LIST', 'LOOK', 'MADE', 'MAKE', 'MANY', 'MORE', 'MOST', 'MUCH',
+    'MUST', 'NAME', 'NEED', 'NEXT', 'ONCE', 'OVER', 'PART', 'SAME', 'SHOW',
+    'SIDE', 'SOME', 'SUCH', 'SURE', 'TAKE', 'TELL', 'THAN', 'THAT', 'THEM',
+    'THEN', 'THEY', 'THIS', 'TOOK', 'VERY', 'WANT', 'WELL', 'WENT', 'WERE',
+    'WHAT', 'WHEN', 'WILL', 'WITH', 'WORK', 'YOUR',
+    # 5+ letter common English
+    'FALSE', 'ABOUT', 'ABOVE', 'AFTER', 'AGAIN', 'BEING', 'BELOW', 'COULD',
+    'EVERY', 'FIRST', 'FOUND', 'NEVER', 'OTHER', 'SHALL', 'SINCE', 'STILL',
+    'THEIR', 'THERE', 'THESE', 'THINK', 'THOSE', 'THREE', 'UNDER', 'UNTIL',
+    'WHERE', 'WHICH', 'WHILE', 'WHOSE', 'WOULD', 'SHOULD', 'THROUGH',
+    'BEFORE', 'BETWEEN', 'BECAUSE', 'DURING', 'WITHOUT', 'ALREADY',
+    'ANOTHER', 'ALWAYS', 'APPEAR', 'CHANGE', 'DISCUSSED', 'IDENTIFIED',
+    'PREVIOUS', 'UPDATED', 'UNLESS',
+    # Technical/formatting labels
+    'CREATED', 'MODIFIED', 'GENERATED', 'MEMORY', 'README',
+    'UTF', 'STDERR', 'STDOUT', 'TYPE', 'LOCAL',
+})
+
+
+def _iter_topic_matches(cleaned):
+    """Yield bold, phrase and acronym matches from one scan of the text.
+
+    A bold match consumes its text, so its (short) inner text is scanned
+    again for the phrases and acronyms inside it. Bold text holds no '*',
+    so that inner scan only ever yields phrase/acronym matches.
+    """
+    for match in _TOPIC_RE.finditer(cleaned):
+        yield match
+        if match.lastgroup == 'bold':
+            yield from _TOPIC_RE.finditer(match.group('bold'))
+
+
+@_cached_claims
 def extract_topic_claims(text):
     """Extract key topic terms from the summary.
 
@@ -245,111 +428,62 @@ def extract_topic_claims(text):
     topics = set()
     user_blacklist = _load_blacklist()
 
-    # Section headers to skip (these are summary structure, not topic claims)
-    section_headers = {
-        'primary request and intent', 'key technical concepts',
-        'files and code sections', 'errors and fixes', 'problem solving',
-        'all user messages', 'pending tasks', 'current work',
-        'optional next step', 'analysis', 'summary',
-    }
-
-    # Status/label words to skip
-    skip_labels = {
-        'NOTE', 'CRITICAL', 'IMPORTANT', 'SOLVED', 'NOT FIXED', 'ONGOING',
-        'MODIFIED', 'CREATED', 'READ', 'GENERATED', 'BUG', 'COMPLETE',
-        'WHAT', 'WHY', 'HOW', 'FIX', 'ERROR', 'FIXED', 'DEFERRED',
-        'IN', 'ADD', 'JUST', 'ONLY', 'CHANGE',
-    }
-
-    # Bold terms: **Something** (domain-specific emphasis)
-    for match in re.finditer(r'\*\*([^*]{3,50})\*\*', cleaned):
-        term = match.group(1).strip()
-        if term.upper() in skip_labels or term.upper() in user_blacklist:
-            continue
-        if term.lower() in section_headers:
-            continue
-        if re.match(r'^Message\s+\d+', term):
-            continue
-        if '/' in term or '\\' in term:
-            continue
-        if _is_formatting_artifact(term):
-            continue
-        if len(term) > 3:
-            topics.add(term)
-
-    # Capitalized multi-word phrases (domain-specific names)
-    for match in re.finditer(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)\b', cleaned):
-        phrase = match.group(1).strip()
-        if phrase.lower() in section_headers:
-            continue
-        if phrase.upper() in user_blacklist:
-            continue
-        if re.match(r'^(Message|Session|Turn|Step|Phase|Option)\s', phrase):
-            continue
-        if _is_formatting_artifact(phrase):
-            continue
-        if len(phrase) > 5:
-            topics.add(phrase)
-
-    # ALL-CAPS acronyms (project-specific abbreviations)
-    # Hardcoded: common English words, technical boilerplate, status labels
-    skip_acr = {
-        # 2-letter
-        'OK', 'ID', 'VS', 'IE', 'EG', 'IF', 'OR', 'IS', 'IT', 'DO', 'AS',
-        'ON', 'TO', 'AT', 'OF', 'NO', 'UP', 'SO', 'BE', 'BY', 'AM', 'AN',
-        'PC', 'IN',
-        # 3-letter
-        'NOT', 'THE', 'AND', 'FOR', 'ALL', 'HAS', 'WAS', 'GET', 'SET', 'PUT',
-        'API', 'CLI', 'URL', 'SQL', 'ADD', 'BUT', 'CAN', 'DID', 'HAD', 'HER',
-        'HIS', 'HIM', 'HOW', 'ITS', 'LET', 'MAY', 'NEW', 'NOW', 'OLD', 'OUR',
-        'OWN', 'RAN', 'SAY', 'SHE', 'THE', 'TRY', 'USE', 'WAY', 'WHO', 'WIN',
-        'YET', 'ANY', 'FEW', 'GOT', 'NOR', 'RUN', 'TWO',
-        # 4-letter
-        'JSON', 'HTML', 'TEXT', 'FILE', 'PATH', 'UUID', 'NULL', 'TRUE', 'ARGS',
-        'HTTP', 'SELF', 'NONE', 'JUST', 'ONLY', 'ALSO', 'BACK', 'BEEN', 'BOTH',
-        'CALL', 'COME', 'DONE', 'EACH', 'EVEN', 'FIND', 'FROM', 'GAVE', 'GOES',
-        'GONE', 'GOOD', 'HAVE', 'HERE', 'INTO', 'KEEP', 'KNOW', 'LAST', 'LEFT',
-        'LIKE', 'LIST', 'LOOK', 'MADE', 'MAKE', 'MANY', 'MORE', 'MOST', 'MUCH',
-        'MUST', 'NAME', 'NEED', 'NEXT', 'ONCE', 'OVER', 'PART', 'SAME', 'SHOW',
-        'SIDE', 'SOME', 'SUCH', 'SURE', 'TAKE', 'TELL', 'THAN', 'THAT', 'THEM',
-        'THEN', 'THEY', 'THIS', 'TOOK', 'VERY', 'WANT', 'WELL', 'WENT', 'WERE',
-        'WHAT', 'WHEN', 'WILL', 'WITH', 'WORK', 'YOUR',
-        # 5+ letter common English
-        'FALSE', 'ABOUT', 'ABOVE', 'AFTER', 'AGAIN', 'BEING', 'BELOW', 'COULD',
-        'EVERY', 'FIRST', 'FOUND', 'NEVER', 'OTHER', 'SHALL', 'SINCE', 'STILL',
-        'THEIR', 'THERE', 'THESE', 'THINK', 'THOSE', 'THREE', 'UNDER', 'UNTIL',
-        'WHERE', 'WHICH', 'WHILE', 'WHOSE', 'WOULD', 'SHOULD', 'THROUGH',
-        'BEFORE', 'BETWEEN', 'BECAUSE', 'DURING', 'WITHOUT', 'ALREADY',
-        'ANOTHER', 'ALWAYS', 'APPEAR', 'CHANGE', 'DISCUSSED', 'IDENTIFIED',
-        'PREVIOUS', 'UPDATED', 'UNLESS',
-        # Technical/formatting labels
-        'CREATED', 'MODIFIED', 'GENERATED', 'MEMORY', 'README',
-        'UTF', 'STDERR', 'STDOUT', 'TYPE', 'LOCAL',
-    }
-    # Merge user blacklist
-    skip_acr.update(user_blacklist)
-    for match in re.finditer(r'\b([A-Z]{2,})\b', cleaned):
-        acr = match.group(1)
-        if acr not in skip_acr:
-            topics.add(acr)
+    skip_acr = _SKIP_ACR | user_blacklist
+    for match in _iter_topic_matches(cleaned):
+        kind = match.lastgroup
+        if kind == 'acr':
+            # ALL-CAPS acronyms (project-specific abbreviations)
+            acr = match.group('acr')
+            if acr not in skip_acr:
+                topics.add(acr)
+        elif kind == 'phrase':
+            # Capitalized multi-word phrases (domain-specific names)
+            phrase = match.group('phrase').strip()
+            if phrase.lower() in _SECTION_HEADERS:
+                continue
+            if phrase.upper() in user_blacklist:
+                continue
+            if _PHRASE_LABEL_RE.match(phrase):
+                continue
+            if _is_formatting_artifact(phrase):
+                continue
+            if len(phrase) > 5:
+                topics.add(phrase)
+        else:
+            # Bold terms: **Something** (domain-specific emphasis)
+            term = match.group('bold').strip()
+            if term.upper() in _SKIP_LABELS or term.upper() in user_blacklist:
+                continue
+            if term.lower() in _SECTION_HEADERS:
+                continue
+            if _MESSAGE_LABEL_RE.match(term):
+                continue
+            if '/' in term or '\\' in term:
+                continue
+            if _is_formatting_artifact(term):
+                continue
+            if len(term) > 3:
+                topics.add(term)
 
     return sorted(topics)
 
 
+@_cached_claims
 def extract_turn_count_claims(text):
     """Extract any turn count claims (e.g., '68-turn', '143 turns')."""
     counts = []
-    for match in re.finditer(r'(\d+)[\s-]*turns?\b', text, re.IGNORECASE):
+    for match in _TURN_COUNT_RE.finditer(text):
         counts.append(int(match.group(1)))
     return counts
 
 
+@_cached_claims
 def extract_function_claims(text):
     """Extract function/class names from code blocks in the summary."""
     names = set()
-    for match in re.finditer(r'\bdef\s+(\w+)\s*\(', text):
+    for match in _DEF_RE.finditer(text):
         names.add(match.group(1))
-    for match in re.finditer(r'\bclass\s+(\w+)', text):
+    for match in _CLASS_RE.finditer(text):
         name = match.group(1)
         # Skip common non-class words that might match
         if name not in ('Task', 'Path', 'Counter'):
@@ -361,6 +495,10 @@ def extract_function_claims(text):
 # ARCHIVE LOADING
 # ============================================================
 
+_SESSION_DATE_RE = re.compile(r'session_(\d{4}-\d{2}-\d{2})')
+_META_KV_RE = re.compile(r'\*\*(\w[\w\s]*)\*\*:\s*(.+)')
+_TURN_HEADER_RE = re.compile(r'^## Turn (\d+) \u2014 (User|Claude) \[(\S*)\]', re.MULTILINE)
+
 def find_archive_dir(start_path):
     """Locate the context_archive directory from a starting path."""
     candidates = [
@@ -389,7 +527,33 @@ def list_session_files(archive_dir):
 
 
 def parse_session_header(filepath):
-    """Parse metadata from a session .md file header."""
+    """Parse metadata from a session .md file header.
+
+    Memoized on (path, mtime, size), so auditing several summaries against
+    the same archive reads each header once. Returns a fresh dict per call.
+    """
+    st = os.stat(filepath)
+    meta = dict(_parse_session_header_cached(str(filepath), st.st_mtime_ns, st.st_size))
+    meta['filepath'] = filepath
+    return meta
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_session_header_cached(filepath, mtime_ns, size):
+    # mtime_ns/size only key the cache: an edited file is re-parsed
+    with open(filepath, 'r', encoding='utf-8') as f:
+        header = f.read(4000)
+    return parse_session_header_text(header, filepath)
+
+
+def parse_session_header_text(text, filepath):
+    """Parse session header metadata from already-read file content.
+
+    Only the first 4000 characters are examined, as parse_session_header
+    does; filepath supplies the name the session date is taken from.
+    """
+    filepath = Path(filepath)
+    header = text[:4000]
     meta = {
         'filepath': filepath,
         'filename': filepath.name,
@@ -401,14 +565,12 @@ def parse_session_header(filepath):
         'session_id': '',
         'date': '',
     }
-    with open(filepath, 'r', encoding='utf-8') as f:
-        header = f.read(4000)
 
-    date_match = re.search(r'session_(\d{4}-\d{2}-\d{2})', filepath.name)
+    date_match = _SESSION_DATE_RE.search(filepath.name)
     if date_match:
         meta['date'] = date_match.group(1)
 
-    for match in re.finditer(r'\*\*(\w[\w\s]*)\*\*:\s*(.+)', header):
+    for match in _META_KV_RE.finditer(header):
         key = match.group(1).strip().lower().replace(' ', '_')
         val = match.group(2).strip().strip('`')
         if key == 'session_id':
@@ -430,13 +592,55 @@ def parse_session_header(filepath):
     return meta
 
 
+class SessionTurns(list):
+    """List of parsed turn dicts that also carries the joined turn text.
+
+    verify_quotes, verify_functions and deep_search_missing all search the
+    concatenated turn content; each join is built on first use and then
+    kept on the list, so an audit joins the archive's turns only once.
+    """
+
+    @functools.cached_property
+    def all_text(self):
+        return ' '.join(t['content'] for t in self)
+
+    @functools.cached_property
+    def all_text_lower(self):
+        return self.all_text.lower()
+
+    @functools.cached_property
+    def user_text_lower(self):
+        return ' '.join(t['content'] for t in self if t['role'] == 'user').lower()
+
+
+def _session_turns(turns):
+    """Return turns as a SessionTurns, wrapping a plain list if needed."""
+    return turns if isinstance(turns, SessionTurns) else SessionTurns(turns)
+
+
 def parse_turns(filepath):
-    """Parse turns from a session .md file."""
+    """Parse turns from a session .md file.
+
+    Memoized like parse_session_header. The list is a fresh SessionTurns
+    per call; the turn dicts inside it are shared and must not be modified.
+    """
+    st = os.stat(filepath)
+    return SessionTurns(_parse_turns_cached(str(filepath), st.st_mtime_ns, st.st_size))
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_turns_cached(filepath, mtime_ns, size):
     with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
+        return _parse_turns_content(f.read())
 
-    turn_pattern = re.compile(r'^## Turn (\d+) \u2014 (User|Claude) \[(\S*)\]', re.MULTILINE)
-    matches = list(turn_pattern.finditer(content))
+
+def parse_turns_text(text):
+    """Parse turns from already-read session .md content."""
+    return SessionTurns(_parse_turns_content(text))
+
+
+def _parse_turns_content(content):
+    matches = list(_TURN_HEADER_RE.finditer(content))
     turns = []
 
     for i, match in enumerate(matches):
@@ -457,22 +661,40 @@ def parse_turns(filepath):
 # VERIFICATION
 # ============================================================
 
+def _normalize_path(path):
+    """Lowercase a path and convert backslashes to forward slashes.
+
+    An escaped (doubled) backslash becomes a single slash. Paths without
+    any backslash skip both replace scans and only pay for the lower().
+    """
+    if '\\' in path:
+        path = path.replace('\\\\', '/').replace('\\', '/')
+    return path.lower()
+
+
+_FILE_LIST_SPLIT_RE = re.compile(r'[\s,]+')
+
+
 def verify_files(claimed_files, archive_meta):
     """Check claimed file paths against archive's Files Referenced."""
-    archive_ref = archive_meta.get('files_referenced', '')
-    # Normalize: lowercase, forward slashes
-    archive_norm = archive_ref.replace('\\\\', '/').replace('\\', '/').lower()
+    archive_norm = _normalize_path(archive_meta.get('files_referenced', ''))
+    # Whole entries and their filenames are substrings of archive_norm, so
+    # a set hit settles most claims without scanning; misses still scan
+    archive_tokens = set()
+    for token in _FILE_LIST_SPLIT_RE.split(archive_norm):
+        archive_tokens.add(token)
+        archive_tokens.add(token.rsplit('/', 1)[-1])
 
     results = []
     for f in claimed_files:
-        f_norm = f.replace('\\\\', '/').replace('\\', '/').lower()
+        f_norm = _normalize_path(f)
         # Direct substring match
-        found = f_norm in archive_norm
+        found = f_norm in archive_tokens or f_norm in archive_norm
         if not found:
             # Try filename-only match (last path component)
             fname = f_norm.rstrip('/').rsplit('/', 1)[-1]
             if len(fname) > 3:
-                found = fname in archive_norm
+                found = fname in archive_tokens or fname in archive_norm
         results.append({
             'claim': f,
             'status': 'FOUND' if found else 'MISSING',
@@ -496,7 +718,13 @@ def verify_tools(claimed_tools, archive_meta):
 
 def verify_quotes(quotes, turns):
     """Search for quoted user messages in archive turn content."""
-    user_text = ' '.join(t['content'] for t in turns if t['role'] == 'user').lower()
+    if not quotes:
+        return []
+    user_text = _session_turns(turns).user_text_lower
+    # Word-overlap lookups repeat across quotes: whole words of user_text
+    # are trivially substrings of it, and everything else is scanned once
+    user_words = set(user_text.split())
+    word_hits = {}
 
     results = []
     for quote in quotes:
@@ -517,7 +745,12 @@ def verify_quotes(quotes, turns):
         # Significant-word overlap (60% threshold)
         words = [w for w in q_lower.split() if len(w) > 4]
         if words:
-            hits = sum(1 for w in words if w in user_text)
+            hits = 0
+            for w in words:
+                hit = word_hits.get(w)
+                if hit is None:
+                    hit = word_hits[w] = w in user_words or w in user_text
+                hits += hit
             if hits >= max(1, len(words) * 0.6):
                 results.append({'claim': display, 'status': 'FOUND'})
                 continue
@@ -561,7 +794,7 @@ def verify_turn_counts(claimed_counts, archive_meta):
 
 def verify_functions(claimed_functions, turns):
     """Search for function/class names in archive turn content."""
-    all_text = ' '.join(t['content'] for t in turns)
+    all_text = _session_turns(turns).all_text
 
     results = []
     for name in claimed_functions:
@@ -580,7 +813,7 @@ def deep_search_missing(missing_claims, turns):
 
     Returns dict of claim -> bool (found in content or not).
     """
-    all_text = ' '.join(t['content'] for t in turns).lower()
+    all_text = _session_turns(turns).all_text_lower
     found_in_content = {}
     for claim in missing_claims:
         # Try the claim text directly
@@ -594,10 +827,53 @@ def deep_search_missing(missing_claims, turns):
     return found_in_content
 
 
+def apply_deep_search(all_results, turns):
+    """Upgrade MISSING results found in full turn content to 'FOUND (deep)'.
+
+    Each category's MISSING results are collected in one pass; categories
+    with none are skipped, and only the collected results are revisited.
+    """
+    for results in all_results.values():
+        missing = [r for r in results if r['status'] == 'MISSING']
+        if not missing:
+            continue
+        found_deep = deep_search_missing([r['claim'] for r in missing], turns)
+        for r in missing:
+            if found_deep.get(r['claim'], False):
+                r['status'] = 'FOUND (deep)'
+
+
 # ============================================================
 # REPORT
 # ============================================================
 
+# Category breakdown bars, indexed by completed 5% steps (0-20)
+_BARS = tuple('#' * i + '-' * (20 - i) for i in range(21))
+
+# Claim status -> (JSON status, location, counter, report marker)
+_STATUS_DISPATCH = {
+    'FOUND': ('FOUND', 'header', 'found', '[FOUND]   '),
+    'FOUND (deep)': ('FOUND', 'deep', 'found', '[DEEP]    '),
+    'MISSING': ('MISSING', 'none', 'missing', '[MISSING] '),
+}
+
+
+# Report marker for a structured claim's (status, location)
+_STRUCTURED_MARKERS = {
+    (json_status, location): marker
+    for json_status, location, _, marker in _STATUS_DISPATCH.values()
+}
+
+
+def _status_dispatch(status):
+    """Look up how a claim status is stored, counted and marked."""
+    entry = _STATUS_DISPATCH.get(status)
+    if entry is None:
+        # 'MISMATCH (archive: N turns)' carries the count, so it can't be a key
+        entry = (status.split(' ')[0], 'none', 'mismatched', '[MISMATCH]')
+    return entry
+
+
 def format_report(all_results, archive_meta=None, summary_info=None):
     """Format verification results as a readable audit report."""
     lines = []
@@ -615,9 +891,7 @@ def format_report(all_results, archive_meta=None, summary_info=None):
         lines.append(f"  Archive date         : {archive_meta.get('date', '?')}")
     lines.append("=" * 64)
 
-    total_found = 0
-    total_missing = 0
-    total_mismatch = 0
+    counts = {'found': 0, 'missing': 0, 'mismatched': 0}
     category_stats = {}
 
     for category, results in all_results.items():
@@ -630,21 +904,13 @@ def format_report(all_results, archive_meta=None, summary_info=None):
 
         lines.append(f"\n  --- {category} ({cat_found}/{cat_total}) ---")
         for r in results:
-            status = r['status']
-            if status == 'FOUND':
-                marker = '[FOUND]   '
-                total_found += 1
-            elif status == 'FOUND (deep)':
-                marker = '[DEEP]    '
-                total_found += 1
-            elif status == 'MISSING':
-                marker = '[MISSING] '
-                total_missing += 1
-            else:
-                marker = '[MISMATCH]'
-                total_mismatch += 1
+            _, _, bucket, marker = _status_dispatch(r['status'])
+            counts[bucket] += 1
             lines.append(f"    {marker} {r['claim']}")
 
+    total_found = counts['found']
+    total_missing = counts['missing']
+    total_mismatch = counts['mismatched']
     total = total_found + total_missing + total_mismatch
     lines.append(f"\n{'=' * 64}")
     lines.append(f"  TOTALS: {total_found} found / {total_missing} missing / {total_mismatch} mismatched")
@@ -658,7 +924,7 @@ def format_report(all_results, archive_meta=None, summary_info=None):
         lines.append("\n  Category Breakdown:")
         for cat, (found, tot) in category_stats.items():
             pct = found / tot * 100 if tot > 0 else 0
-            bar = '#' * int(pct / 5) + '-' * (20 - int(pct / 5))
+            bar = _BARS[int(pct / 5)]
             lines.append(f"    {cat:<22} [{bar}] {pct:3.0f}%")
 
     return '\n'.join(lines)
@@ -673,55 +939,37 @@ def build_structured_results(all_results, archive_meta=None, summary_info=None):
 
     Returns a dict suitable for JSON serialization or history logging.
     """
-    timestamp = summary_info.get('timestamp', '') if summary_info else ''
+    timestamp = ''
+    if summary_info:
+        # run_audit records audited_at once, so every result built from
+        # one audit without a compaction timestamp shares the same time
+        timestamp = summary_info.get('timestamp') or summary_info.get('audited_at', '')
     if not timestamp:
         timestamp = datetime.now(timezone.utc).isoformat()
 
-    total_found = 0
-    total_missing = 0
-    total_mismatch = 0
+    # Severity-weighted score, accumulated as each category is counted
+    weighted_found = 0
+    weighted_total = 0
     categories = {}
     claims = []
-    claim_counter = {}
 
     for category, results in all_results.items():
+        severity, weight, prefix = _CATEGORY_META.get(category) or _category_meta(category)
         if not results:
             categories[category] = {
                 'total': 0, 'found': 0, 'missing': 0, 'mismatched': 0,
-                'rate': 1.0, 'severity': CATEGORY_SEVERITY.get(category, 'INFO'),
+                'rate': 1.0, 'severity': severity,
             }
             continue
 
-        severity = CATEGORY_SEVERITY.get(category, 'INFO')
-        cat_found = 0
-        cat_missing = 0
-        cat_mismatch = 0
+        cat_counts = {'found': 0, 'missing': 0, 'mismatched': 0}
 
-        # Generate claim IDs: fp-1, fp-2, tu-1, etc.
-        prefix = ''.join(w[0].lower() for w in category.split('/')[:1])
-        if category not in claim_counter:
-            claim_counter[category] = 0
+        # all_results keys are unique, so claim numbering restarts per category
+        for n, r in enumerate(results, 1):
+            cid = f"{prefix}-{n}"
 
-        for r in results:
-            claim_counter[category] += 1
-            cid = f"{prefix}-{claim_counter[category]}"
-
-            status = r['status']
-            if status.startswith('FOUND'):
-                cat_found += 1
-                total_found += 1
-                location = 'deep' if 'deep' in status else 'header'
-            elif status == 'MISSING':
-                cat_missing += 1
-                total_missing += 1
-                location = 'none'
-            else:
-                cat_mismatch += 1
-                total_mismatch += 1
-                location = 'none'
-
-            # Normalize status for JSON
-            json_status = 'FOUND' if status.startswith('FOUND') else status.split(' ')[0]
+            json_status, location, bucket, _ = _status_dispatch(r['status'])
+            cat_counts[bucket] += 1
 
             claims.append({
                 'id': cid,
@@ -732,7 +980,12 @@ def build_structured_results(all_results, archive_meta=None, summary_info=None):
                 'location': location,
             })
 
+        cat_found = cat_counts['found']
+        cat_missing = cat_counts['missing']
+        cat_mismatch = cat_counts['mismatched']
         cat_total = cat_found + cat_missing + cat_mismatch
+        weighted_found += cat_found * weight
+        weighted_total += cat_total * weight
         categories[category] = {
             'total': cat_total,
             'found': cat_found,
@@ -742,16 +995,11 @@ def build_structured_results(all_results, archive_meta=None, summary_info=None):
             'severity': severity,
         }
 
+    total_found = sum(c['found'] for c in categories.values())
+    total_missing = sum(c['missing'] for c in categories.values())
+    total_mismatch = sum(c['mismatched'] for c in categories.values())
     total = total_found + total_missing + total_mismatch
 
-    # Severity-weighted score
-    weighted_found = 0
-    weighted_total = 0
-    for category, stats in categories.items():
-        weight = SEVERITY_WEIGHT.get(stats['severity'], 1)
-        weighted_found += stats['found'] * weight
-        weighted_total += stats['total'] * weight
-
     result = {
         'timestamp': timestamp,
         'session_id': archive_meta.get('session_id', '') if archive_meta else '',
@@ -772,10 +1020,15 @@ def build_structured_results(all_results, archive_meta=None, summary_info=None):
     return result
 
 
-def format_json_report(all_results, archive_meta=None, summary_info=None):
-    """Format verification results as structured JSON string."""
-    result = build_structured_results(all_results, archive_meta, summary_info)
-    return json.dumps(result, indent=2, ensure_ascii=False)
+def format_json_report(all_results, archive_meta=None, summary_info=None,
+                       structured=None):
+    """Format verification results as structured JSON string.
+
+    Pass structured to reuse results already built by build_structured_results.
+    """
+    if structured is None:
+        structured = build_structured_results(all_results, archive_meta, summary_info)
+    return json.dumps(structured, indent=2, ensure_ascii=False)
 
 
 # ============================================================
@@ -792,9 +1045,8 @@ def load_audit_history(history_path):
         return history
     with open(history_path, 'r', encoding='utf-8') as f:
         for line in f:
-            line = line.strip()
-            if not line:
-                continue
+            # No strip(): json.loads accepts the trailing newline, and a
+            # blank line is skipped by the JSONDecodeError handler below
             try:
                 history.append(json.loads(line))
             except json.JSONDecodeError:
@@ -802,16 +1054,148 @@ def load_audit_history(history_path):
     return history
 
 
+_HISTORY_TAIL_BLOCK = 64 * 1024
+
+
+def load_audit_history_tail(history_path, n):
+    """Load the last n runs of an audit history file.
+
+    Reads the file backwards in 64 KB blocks and parses only the lines it
+    reaches, so the cost does not grow with the length of the history.
+    Invalid lines are skipped as in load_audit_history.
+    """
+    runs = []
+    if n <= 0 or not history_path or not Path(history_path).exists():
+        return runs
+    with open(history_path, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        partial = b''
+        while pos > 0 and len(runs) < n:
+            step = min(_HISTORY_TAIL_BLOCK, pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + partial).split(b'\n')
+            # Unless the start of the file was reached, the first piece may
+            # be the end of a longer line; keep it for the next block
+            partial = lines.pop(0) if pos > 0 else b''
+            for raw in reversed(lines):
+                try:
+                    runs.append(json.loads(raw.decode('utf-8')))
+                except (UnicodeDecodeError, json.JSONDecodeError):
+                    continue
+                if len(runs) == n:
+                    break
+    runs.reverse()
+    return runs
+
+
+# A run line as written by json.dumps: ends in '}' (text-mode appends on
+# Windows add '\r'); blank lines and truncated writes do not match
+_HISTORY_RUN_END_RE = re.compile(rb'\}[ \t\r]*(?:\n|\Z)')
+
+
+def count_audit_runs(history_path):
+    """Count the runs in an audit history file without parsing them.
+
+    Counts lines ending in '}', the same test _history_line_rate applies
+    before decoding; scanned through mmap with one regex pass.
+    """
+    if not history_path or not Path(history_path).exists():
+        return 0
+    with open(history_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return 0    # mmap refuses empty files
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return sum(1 for _ in _HISTORY_RUN_END_RE.finditer(mm))
+
+
+# History lines come from json.dumps, where the small 'summary' object is
+# written ahead of the bulky categories/claims
+_HISTORY_SUMMARY_RE = re.compile(r'"summary"\s*:\s*')
+_json_decoder = json.JSONDecoder()
+
+
+def _history_line_rate(line):
+    """Return a history line's summary rate, or None if the line is invalid.
+
+    Decodes only the 'summary' object; a line without one (or with an
+    unexpected shape) falls back to a full parse. Lines not closed by '}'
+    are treated as truncated writes, as a full parse would reject them.
+    Damage past the summary that still ends in '}' goes unnoticed here,
+    which only a crash mid-append followed by another append can produce.
+    """
+    if not line.rstrip().endswith('}'):
+        return None
+    match = _HISTORY_SUMMARY_RE.search(line)
+    if match:
+        try:
+            summary, _ = _json_decoder.raw_decode(line, match.end())
+        except json.JSONDecodeError:
+            summary = None
+        if isinstance(summary, dict):
+            return summary.get('rate', 0)
+    try:
+        run = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    return run.get('summary', {}).get('rate', 0)
+
+
+def load_history_digest(history_path):
+    """Load just what the trend report needs from an audit history file.
+
+    Returns (rates, last_run): every run's summary rate in order, and the
+    newest run fully parsed (None if there is no history). Unlike
+    load_audit_history, only the last run is decoded in full, and only
+    line offsets are kept rather than the lines themselves.
+    """
+    rates = []
+    offsets = []
+    if not history_path or not Path(history_path).exists():
+        return rates, None
+    with open(history_path, 'rb') as f:
+        pos = 0
+        for raw in f:
+            rate = _history_line_rate(raw.decode('utf-8'))
+            if rate is not None:
+                rates.append(rate)
+                offsets.append(pos)
+            pos += len(raw)
+        # A line can pass the summary check yet fail a full parse; drop such
+        # trailing lines so last_run and rates match load_audit_history
+        while offsets:
+            f.seek(offsets[-1])
+            try:
+                return rates, json.loads(f.readline().decode('utf-8'))
+            except json.JSONDecodeError:
+                offsets.pop()
+                rates.pop()
+    return rates, None
+
+
+def to_percent(rate):
+    """Scale a 0-1 float rate to 0-100; other values are already percentages."""
+    return rate * 100 if type(rate) is float and rate <= 1 else rate
+
+
+def trend_from_rates(rates):
+    """Build a trend string like '71% → 71% → 95%' from summary rates."""
+    return ' \u2192 '.join(f"{rate * 100:.0f}%" for rate in rates)
+
+
 def compute_trend_line(history):
     """Build a trend string like '71% → 71% → 95%' from history."""
     if not history:
         return None
-    rates = []
-    for run in history:
-        summary = run.get('summary', {})
-        rate = summary.get('rate', 0)
-        rates.append(f"{rate * 100:.0f}%")
-    return ' \u2192 '.join(rates)
+    return trend_from_rates(run.get('summary', {}).get('rate', 0) for run in history)
+
+
+def _by_severity(categories):
+    """Return categories.items() ordered most severe first, then by name."""
+    return sorted(
+        categories.items(),
+        key=lambda kv: (-SEVERITY_WEIGHT.get(kv[1].get('severity', 'INFO'), 1), kv[0]),
+    )
 
 
 def detect_regressions(current, previous):
@@ -824,7 +1208,7 @@ def detect_regressions(current, previous):
     regressions = []
     prev_cats = previous.get('categories', {})
     curr_cats = current.get('categories', {})
-    for cat, curr_stats in curr_cats.items():
+    for cat, curr_stats in _by_severity(curr_cats):
         prev_stats = prev_cats.get(cat, {})
         prev_rate = prev_stats.get('rate', 1.0)
         curr_rate = curr_stats.get('rate', 1.0)
@@ -837,13 +1221,24 @@ def detect_regressions(current, previous):
 
 
 def format_report_with_trends(all_results, archive_meta=None, summary_info=None,
-                               history=None):
+                               history=None, history_rates=None, previous_run=None,
+                               structured=None):
     """Enhanced text report with trend line, regressions, and severity score.
 
+    Only past summary rates and the previous run are used, so callers can
+    pass history_rates/previous_run (see load_history_digest) instead of
+    the full history list. Optionally takes prebuilt structured results.
     Falls back to basic format_report if no history available.
     """
     # Build structured data for this run
-    structured = build_structured_results(all_results, archive_meta, summary_info)
+    if structured is None:
+        structured = build_structured_results(all_results, archive_meta, summary_info)
+
+    if history_rates is None and history:
+        history_rates = [run.get('summary', {}).get('rate', 0) for run in history]
+        previous_run = history[-1]
+    # Rates may arrive as any iterable; the run number needs their count
+    rates = list(history_rates or ())
 
     lines = []
     lines.append("=" * 64)
@@ -860,12 +1255,12 @@ def format_report_with_trends(all_results, archive_meta=None, summary_info=None,
         lines.append(f"  Archive date         : {archive_meta.get('date', '?')}")
 
     # Run metadata
-    run_number = (len(history) + 1) if history else 1
+    run_number = len(rates) + 1
     lines.append(f"  Run number           : {run_number}")
 
     # Trend line
-    if history:
-        past_trend = compute_trend_line(history)
+    if rates:
+        past_trend = trend_from_rates(rates)
         current_rate = structured['summary']['rate']
         trend = f"{past_trend} \u2192 {current_rate * 100:.0f}%"
         lines.append(f"  Trend                : {trend}")
@@ -873,8 +1268,8 @@ def format_report_with_trends(all_results, archive_meta=None, summary_info=None,
     lines.append("=" * 64)
 
     # Regression alerts
-    if history:
-        regressions = detect_regressions(structured, history[-1])
+    if rates:
+        regressions = detect_regressions(structured, previous_run)
         if regressions:
             lines.append("\n  *** REGRESSIONS DETECTED ***")
             for r in regressions:
@@ -882,57 +1277,46 @@ def format_report_with_trends(all_results, archive_meta=None, summary_info=None,
         else:
             lines.append("\n  No regressions vs previous run.")
 
-    # Per-category results (same as original format_report)
-    total_found = 0
-    total_missing = 0
-    total_mismatch = 0
-    category_stats = {}
-
-    for category, results in all_results.items():
-        if not results:
-            continue
-
-        severity = CATEGORY_SEVERITY.get(category, 'INFO')
-        cat_found = sum(1 for r in results if r['status'].startswith('FOUND'))
-        cat_total = len(results)
-        category_stats[category] = (cat_found, cat_total, severity)
-
-        lines.append(f"\n  --- {category} [{severity}] ({cat_found}/{cat_total}) ---")
-        for r in results:
-            status = r['status']
-            if status == 'FOUND':
-                marker = '[FOUND]   '
-                total_found += 1
-            elif status == 'FOUND (deep)':
-                marker = '[DEEP]    '
-                total_found += 1
-            elif status == 'MISSING':
-                marker = '[MISSING] '
-                total_missing += 1
-            else:
-                marker = '[MISMATCH]'
-                total_mismatch += 1
-            lines.append(f"    {marker} {r['claim']}")
-
-    total = total_found + total_missing + total_mismatch
+    # Per-category results, rendered from the structured data so the claim
+    # statuses are classified and counted only once
+    summary = structured['summary']
+    claims_by_category = {
+        category: list(claims)
+        for category, claims in itertools.groupby(structured['claims'], key=itemgetter('category'))
+    }
+    # Most severe first; the same ordering feeds the breakdown below
+    ordered = [(cat, stats) for cat, stats in _by_severity(structured['categories'])
+               if stats['total'] > 0]
+
+    for category, stats in ordered:
+        severity = stats['severity']
+        lines.append(f"\n  --- {category} [{severity}] ({stats['found']}/{stats['total']}) ---")
+        # One joined block per category rather than an append per claim
+        lines.append('\n'.join(
+            f"    {_STRUCTURED_MARKERS.get((c['status'], c['location']), '[MISMATCH]')} {c['claim']}"
+            for c in claims_by_category[category]
+        ))
+
+    total_found = summary['found']
+    total = summary['total']
     lines.append(f"\n{'=' * 64}")
-    lines.append(f"  TOTALS: {total_found} found / {total_missing} missing / {total_mismatch} mismatched")
+    lines.append(f"  TOTALS: {total_found} found / {summary['missing']} missing / {summary['mismatched']} mismatched")
     if total > 0:
         pct = total_found / total * 100
         lines.append(f"  Verification rate: {pct:.0f}% ({total_found}/{total} claims)")
 
     # Severity-weighted score
-    sw_rate = structured['summary']['severity_weighted_rate']
+    sw_rate = summary['severity_weighted_rate']
     lines.append(f"  Severity-weighted  : {sw_rate * 100:.0f}%")
     lines.append("=" * 64)
 
     # Category breakdown with severity
-    if category_stats:
+    if ordered:
         lines.append("\n  Category Breakdown:")
-        for cat, (found, tot, sev) in category_stats.items():
-            pct = found / tot * 100 if tot > 0 else 0
-            bar = '#' * int(pct / 5) + '-' * (20 - int(pct / 5))
-            lines.append(f"    {cat:<22} [{bar}] {pct:3.0f}%  ({sev})")
+        for cat, stats in ordered:
+            pct = stats['found'] / stats['total'] * 100
+            bar = _BARS[int(pct / 5)]
+            lines.append(f"    {cat:<22} [{bar}] {pct:3.0f}%  ({stats['severity']})")
 
     return '\n'.join(lines), structured
 
@@ -941,6 +1325,22 @@ def format_report_with_trends(all_results, archive_meta=None, summary_info=None,
 # MAIN
 # ============================================================
 
+def _index_session_files(session_files):
+    """Map each session file's name, and its 8-char session id, to the file.
+
+    Names look like session_DATE_ID[~TAGS].md; when two files share an id
+    the first one wins, as a front-to-back scan would pick it.
+    """
+    by_name = {}
+    by_sid = {}
+    for sf in session_files:
+        by_name[sf.name] = sf
+        parts = sf.name.split('_', 2)
+        if len(parts) == 3:
+            by_sid.setdefault(parts[2][:8], sf)
+    return by_name, by_sid
+
+
 def run_audit(args):
     """Core audit logic shared by main() and autoarchive imports.
 
@@ -978,6 +1378,9 @@ def run_audit(args):
               f"(line {chosen.get('line', '?')}, {len(summary_text)} chars)",
               file=sys.stderr)
 
+    if not summary_info.get('timestamp'):
+        summary_info['audited_at'] = datetime.now(timezone.utc).isoformat()
+
     # ---- Find archive ----
     archive_dir = None
     if args.archive:
@@ -1001,20 +1404,21 @@ def run_audit(args):
     session_files = list_session_files(archive_dir)
     target = None
 
+    by_name, by_sid = _index_session_files(session_files)
+
     if hasattr(args, 'session') and args.session:
-        for sf in session_files:
-            if args.session in sf.name or args.session in str(sf):
-                target = sf
-                break
+        target = by_name.get(args.session)
+        if target is None:
+            # The name is the tail of the full path, so matching the path covers both
+            target = next((sf for sf in session_files if args.session in str(sf)), None)
         if not target:
             print(f"ERROR: No session file matching '{args.session}'", file=sys.stderr)
             sys.exit(1)
     elif session_id_hint:
         sid_short = session_id_hint[:8]
-        for sf in session_files:
-            if sid_short in sf.name:
-                target = sf
-                break
+        target = by_sid.get(sid_short)
+        if target is None:
+            target = next((sf for sf in session_files if sid_short in sf.name), None)
     if not target and session_files:
         target = session_files[-1]
     if not target:
@@ -1048,13 +1452,7 @@ def run_audit(args):
     # ---- Deep search for MISSING claims ----
     deep = getattr(args, 'deep', False)
     if deep:
-        for category, results in all_results.items():
-            missing = [r['claim'] for r in results if r['status'] == 'MISSING']
-            if missing:
-                found_deep = deep_search_missing(missing, archive_turns)
-                for r in results:
-                    if r['status'] == 'MISSING' and found_deep.get(r['claim'], False):
-                        r['status'] = 'FOUND (deep)'
+        apply_deep_search(all_results, archive_turns)
 
     return all_results, archive_meta, summary_info, archive_dir
 
@@ -1098,22 +1496,25 @@ def main():
         sys.exit(1)
 
     all_results, archive_meta, summary_info, archive_dir = result
+    # Built once here and handed to whichever renderer runs
+    structured = build_structured_results(all_results, archive_meta, summary_info)
 
     if args.output_format == 'json':
-        print(format_json_report(all_results, archive_meta, summary_info))
+        print(format_json_report(all_results, structured=structured))
     else:
         # Load history for trend-aware report
-        history = []
+        rates, previous_run = [], None
         history_path = args.history_file
         if not history_path and archive_dir:
             default_history = Path(archive_dir) / 'audit_history.jsonl'
             if default_history.exists():
                 history_path = str(default_history)
         if history_path:
-            history = load_audit_history(history_path)
+            rates, previous_run = load_history_digest(history_path)
 
         report, _ = format_report_with_trends(
-            all_results, archive_meta, summary_info, history
+            all_results, archive_meta, summary_info, history_rates=rates,
+            previous_run=previous_run, structured=structured
         )
         print(report)
 
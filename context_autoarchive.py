@@ -38,6 +38,12 @@ TOOLS_DIR = Path(__file__).parent
 if str(TOOLS_DIR) not in sys.path:
     sys.path.insert(0, str(TOOLS_DIR))
 
+import context_auditor
+import context_preserver
+
+# Past runs shown in the beacon/report trend (the current run is appended)
+TREND_HISTORY_RUNS = 50
+
 
 def read_hook_stdin():
     """Read and parse JSON from stdin (sent by Claude Code hooks).
@@ -73,6 +79,28 @@ def resolve_project_path(args, hook_data):
     return os.path.abspath(os.getcwd())
 
 
+def _latest_file(dirpath, prefix, suffix):
+    """Return the most recently modified file in dirpath matching prefix/suffix.
+
+    Single os.scandir pass; DirEntry caches its stat result, so there is no
+    second stat per file as with Path.glob + f.stat(). Returns None if no
+    file matches.
+    """
+    with os.scandir(dirpath) as it:
+        best = max(
+            (e for e in it
+             if e.name.startswith(prefix) and e.name.endswith(suffix) and e.is_file()),
+            key=lambda e: e.stat().st_mtime,
+            default=None,
+        )
+    return Path(best.path) if best is not None else None
+
+
+def _pct(r):
+    """Rate as a rounded 0-100 percentage (see context_auditor.to_percent)."""
+    return round(context_auditor.to_percent(r))
+
+
 def phase_pre(project_path):
     """Pre-compaction phase: archive current session state + inject ground truth.
 
@@ -86,28 +114,19 @@ def phase_pre(project_path):
     """
     print(f"[autoarchive:pre] Archiving {project_path}", file=sys.stderr)
 
-    try:
-        import context_preserver
-    except ImportError as e:
-        print(f"[autoarchive:pre] ERROR: Cannot import context_preserver: {e}", file=sys.stderr)
-        return False
-
-    # Capture preserver's stdout (it prints progress there)
+    # Route preserver's stdout (it prints progress there) straight to stderr:
+    # informational, not for context injection
     old_stdout = sys.stdout
     old_argv = sys.argv
-    captured = io.StringIO()
 
     try:
-        sys.stdout = captured
+        sys.stdout = sys.stderr
         sys.argv = ['context_preserver', '--project-path', project_path]
         context_preserver.main()
     except SystemExit as e:
         if e.code and e.code != 0:
             sys.stdout = old_stdout
             print(f"[autoarchive:pre] Preserver exited with code {e.code}", file=sys.stderr)
-            output = captured.getvalue()
-            if output:
-                print(output, file=sys.stderr)
             return False
     except Exception as e:
         sys.stdout = old_stdout
@@ -117,44 +136,37 @@ def phase_pre(project_path):
         sys.stdout = old_stdout
         sys.argv = old_argv
 
-    # Send preserver output to stderr (informational, not for context injection)
-    output = captured.getvalue()
-    if output:
-        print(output, file=sys.stderr)
-
     print("[autoarchive:pre] Archive complete", file=sys.stderr)
 
     # --- Ground Truth Injection ---
     # Read the archive file just written and output structured metadata to stdout.
     # This gets injected into context before compaction generates its summary.
     try:
-        import context_auditor
-
         archive_dir = Path(project_path) / 'context_archive'
         if not archive_dir.is_dir():
             print("[autoarchive:pre] No archive dir for ground truth", file=sys.stderr)
             return True  # Archive succeeded, just no ground truth to inject
 
         # Find the most recently modified session file
-        session_files = sorted(
-            archive_dir.glob("session_*.md"),
-            key=lambda f: f.stat().st_mtime
-        )
-        if not session_files:
+        target = _latest_file(archive_dir, "session_", ".md")
+        if target is None:
             print("[autoarchive:pre] No session files for ground truth", file=sys.stderr)
             return True
 
-        target = session_files[-1]
         print(f"[autoarchive:pre] Ground truth source: {target.name}", file=sys.stderr)
 
+        # Read the archive once; header, turn count and turns all parse it
+        with open(target, 'r', encoding='utf-8') as f:
+            archive_text = f.read()
+
         # Parse header metadata
-        meta = context_auditor.parse_session_header(target)
+        meta = context_auditor.parse_session_header_text(archive_text, target)
 
         # Count actual turns (more reliable than header field)
-        turn_count = context_preserver.get_archived_turn_count(target)
+        turn_count = context_preserver.count_turn_headers(archive_text)
 
         # Extract first and last turn timestamps for duration
-        turns = context_auditor.parse_turns(target)
+        turns = context_auditor.parse_turns_text(archive_text)
         first_time = turns[0]['time'] if turns else '?'
         last_time = turns[-1]['time'] if turns else '?'
 
@@ -194,7 +206,8 @@ def phase_pre(project_path):
             }
             pending_path = reports_dir / 'ground_truth_pending.json'
             with open(pending_path, 'w', encoding='utf-8') as f:
-                json.dump(ground_truth, f, indent=2, ensure_ascii=False)
+                f.write(json.dumps(ground_truth, separators=(',', ':'),
+                                   ensure_ascii=False))
             print(f"[autoarchive:pre] Ground truth saved: {pending_path.name}",
                   file=sys.stderr)
         except Exception as e:
@@ -221,13 +234,6 @@ def phase_post(project_path):
     """
     print(f"[autoarchive:post] Auditing compaction for {project_path}", file=sys.stderr)
 
-    try:
-        import context_preserver
-        import context_auditor
-    except ImportError as e:
-        print(f"[autoarchive:post] ERROR: Cannot import tools: {e}", file=sys.stderr)
-        return False
-
     # Find the Claude project directory with .jsonl files
     try:
         project_dir = context_preserver.find_project_dir(project_path)
@@ -236,7 +242,11 @@ def phase_post(project_path):
         return False
 
     # Search all .jsonl files for compaction summaries
-    jsonl_files = sorted(project_dir.glob("*.jsonl"))
+    with os.scandir(project_dir) as it:
+        jsonl_files = sorted(
+            (e for e in it if e.name.endswith('.jsonl') and e.is_file()),
+            key=lambda e: e.name
+        )
     if not jsonl_files:
         print("[autoarchive:post] No .jsonl files found", file=sys.stderr)
         print("[COMPACTION AUDIT — auto-generated]")
@@ -244,12 +254,13 @@ def phase_post(project_path):
         print(f"Project: {project_path}")
         return True
 
+    # Index pass: note where each summary is, without holding its text
     all_summaries = []
     for jf in jsonl_files:
         try:
-            summaries = context_auditor.find_compaction_summaries(str(jf))
+            summaries = context_auditor.find_compaction_summary_index(jf.path)
             for s in summaries:
-                s['jsonl_file'] = jf
+                s['jsonl_file'] = jf.path
             all_summaries.extend(summaries)
         except Exception as e:
             print(f"[autoarchive:post] Warning: Error reading {jf.name}: {e}", file=sys.stderr)
@@ -264,9 +275,16 @@ def phase_post(project_path):
     # Sort by timestamp to find the chronologically latest compaction
     all_summaries.sort(key=lambda s: s.get('timestamp', ''))
 
-    # Use the latest compaction summary
+    # Use the latest compaction summary; only its text is read back
     latest = all_summaries[-1]
-    summary_text = latest['text']
+    try:
+        summary_text = context_auditor.read_compaction_summary(
+            latest['jsonl_file'], latest['offset']
+        )
+    except (OSError, ValueError) as e:
+        print(f"[autoarchive:post] ERROR: Cannot read compaction summary: {e}",
+              file=sys.stderr)
+        return False
     session_id_hint = latest.get('session_id', '')
     summary_info = {
         'timestamp': latest.get('timestamp', ''),
@@ -327,23 +345,19 @@ def phase_post(project_path):
     )
 
     # Deep search for MISSING claims in full turn content
-    for category, results in all_results.items():
-        missing = [r['claim'] for r in results if r['status'] == 'MISSING']
-        if missing:
-            found_deep = context_auditor.deep_search_missing(missing, archive_turns)
-            for r in results:
-                if r['status'] == 'MISSING' and found_deep.get(r['claim'], False):
-                    r['status'] = 'FOUND (deep)'
-
-    # Load audit history for trend analysis
+    context_auditor.apply_deep_search(all_results, archive_turns)
+
+    # Load recent audit history for trend analysis; the trend and the
+    # regression check only look at the tail, so older runs are just counted
     history_path = archive_dir / 'audit_history.jsonl'
-    history = context_auditor.load_audit_history(str(history_path))
+    history = context_auditor.load_audit_history_tail(str(history_path), TREND_HISTORY_RUNS)
+    run_count = context_auditor.count_audit_runs(str(history_path))
 
     # Build structured results for history log
     structured = context_auditor.build_structured_results(
         all_results, archive_meta, summary_info
     )
-    structured['run'] = len(history) + 1
+    structured['run'] = run_count + 1
 
     # Append to audit_history.jsonl (data-sacred: append-only)
     try:
@@ -356,13 +370,14 @@ def phase_post(project_path):
 
     # --- Report Bundling ---
     # Bundle ground truth + compaction summary + audit into single report file
-    reports_dir = archive_dir / 'compaction_reports'
-    reports_dir.mkdir(parents=True, exist_ok=True)
+    # Plain string paths: they are only opened, checked and removed below
+    reports_dir = os.path.join(archive_dir, 'compaction_reports')
+    os.makedirs(reports_dir, exist_ok=True)
 
     # Read ground truth from pre-phase (if available)
     ground_truth = None
-    pending_path = reports_dir / 'ground_truth_pending.json'
-    if pending_path.exists():
+    pending_path = os.path.join(reports_dir, 'ground_truth_pending.json')
+    if os.path.exists(pending_path):
         try:
             with open(pending_path, 'r', encoding='utf-8') as f:
                 ground_truth = json.load(f)
@@ -370,14 +385,10 @@ def phase_post(project_path):
             print(f"[autoarchive:post] Warning: Could not read ground truth: {e}",
                   file=sys.stderr)
 
-    # Build trend from history + current run
-    trend = []
-    for h in history:
-        s = h.get('summary', {})
-        r = s.get('rate', 0)
-        trend.append(round(r * 100) if isinstance(r, float) and r <= 1 else round(r))
-    current_rate = structured.get('summary', {}).get('rate', 0)
-    current_pct = round(current_rate * 100) if isinstance(current_rate, float) and current_rate <= 1 else round(current_rate)
+    # Build trend from recent history + current run
+    trend = [_pct((h.get('summary') or {}).get('rate', 0))
+             for h in history]
+    current_pct = _pct(structured.get('summary', {}).get('rate', 0))
     trend.append(current_pct)
 
     # Detect regressions (>5pp drop from previous run)
@@ -386,27 +397,25 @@ def phase_post(project_path):
         prev = history[-1]
         prev_cats = prev.get('categories', {})
         curr_cats = structured.get('categories', {})
-        for cat in curr_cats:
-            if cat in prev_cats:
-                prev_r = prev_cats[cat].get('rate', 0)
-                curr_r = curr_cats[cat].get('rate', 0)
-                if isinstance(prev_r, float) and prev_r <= 1:
-                    prev_r = round(prev_r * 100)
-                if isinstance(curr_r, float) and curr_r <= 1:
-                    curr_r = round(curr_r * 100)
-                if curr_r < prev_r - 5:
-                    regressions.append({
-                        'category': cat,
-                        'previous': prev_r,
-                        'current': curr_r,
-                    })
+        for cat, curr_v in curr_cats.items():
+            prev_v = prev_cats.get(cat)
+            if prev_v is None:
+                continue
+            prev_r = _pct(prev_v.get('rate', 0))
+            curr_r = _pct(curr_v.get('rate', 0))
+            if curr_r < prev_r - 5:
+                regressions.append({
+                    'category': cat,
+                    'previous': prev_r,
+                    'current': curr_r,
+                })
 
     # Build bundled report
     bundled = {
         'report_version': 1,
         'timestamp': datetime.now().isoformat(),
         'session_id': session_id_hint or structured.get('session_id', '?'),
-        'run_number': structured.get('run', len(history) + 1),
+        'run_number': structured['run'],
     }
     if ground_truth:
         bundled['ground_truth'] = ground_truth
@@ -426,26 +435,28 @@ def phase_post(project_path):
 
     # Save bundled report
     ts_str = datetime.now().strftime('%Y-%m-%d_%H%M%S')
-    report_path = reports_dir / f'compaction_report_{ts_str}.json'
+    report_name = f'compaction_report_{ts_str}.json'
+    report_path = os.path.join(reports_dir, report_name)
     try:
+        # Compact, single write: the report is read by the dashboard, and
+        # json.dump with indent falls back to the pure-Python encoder
         with open(report_path, 'w', encoding='utf-8') as f:
-            json.dump(bundled, f, indent=2, ensure_ascii=False)
-        print(f"[autoarchive:post] Bundled report: {report_path.name}", file=sys.stderr)
+            f.write(json.dumps(bundled, separators=(',', ':'), ensure_ascii=False))
+        print(f"[autoarchive:post] Bundled report: {report_name}", file=sys.stderr)
     except Exception as e:
         print(f"[autoarchive:post] Warning: Could not write bundled report: {e}",
               file=sys.stderr)
         report_path = None
 
     # Delete pending ground truth file after successful bundle
-    if ground_truth and pending_path.exists():
+    if ground_truth:
         try:
-            pending_path.unlink()
+            os.remove(pending_path)
         except OSError:
             pass
 
     # Brief stdout beacon (replaces full report wall — details in bundled JSON)
-    weighted = structured.get('summary', {}).get('severity_weighted_rate', 0)
-    weighted_pct = round(weighted * 100) if isinstance(weighted, float) and weighted <= 1 else round(weighted)
+    weighted_pct = _pct(structured.get('summary', {}).get('severity_weighted_rate', 0))
     trend_str = ' \u2192 '.join(str(t) + '%' for t in trend)
     print("=== COMPACTION AUDIT ===")
     print(f"Run {structured.get('run', '?')}: {current_pct}% (severity-weighted: {weighted_pct}%)")
@@ -465,12 +476,8 @@ def phase_post(project_path):
     try:
         plans_dir = Path(os.path.expanduser("~")) / ".claude" / "plans"
         if plans_dir.is_dir():
-            plan_files = sorted(
-                plans_dir.glob("*.md"),
-                key=lambda f: f.stat().st_mtime
-            )
-            if plan_files:
-                latest_plan = plan_files[-1]
+            latest_plan = _latest_file(plans_dir, "", ".md")
+            if latest_plan is not None:
                 print(f"\nActive plan file: {latest_plan}")
                 print(f"[autoarchive:post] Plan file detected: {latest_plan.name}",
                       file=sys.stderr)
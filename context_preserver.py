@@ -461,6 +461,14 @@ def get_archived_turn_count(filepath: Path) -> int:
     return count
 
 
+def count_turn_headers(text: str) -> int:
+    """Count ## Turn headers in already-read .md content.
+
+    Same rule as get_archived_turn_count, for callers that hold the text.
+    """
+    return len(re.findall(r'^## Turn \d+ ', text, re.MULTILINE))
+
+
 def find_active_file(existing_all: list) -> Path:
     """Find the file with the highest enrichment version (the active save target).
 
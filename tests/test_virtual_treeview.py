@@ -0,0 +1,130 @@
+"""VirtualTreeview scrolling, driven through a stand-in Treeview (no display needed)."""
+
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import bcp_dashboard  # noqa: E402
+
+HEADER_H = 35
+ROW_H = 30  # taller than the 20px fallback, as at 150% scaling
+FITS = 10   # rows that fit below the header
+WIDGET_H = HEADER_H + FITS * ROW_H
+
+
+class FakeTreeview:
+    """Just enough of ttk.Treeview for VirtualTreeview, with a fixed row height."""
+
+    def __init__(self, *args, **kwargs):
+        self.tk = SimpleNamespace(call=lambda *a: '')  # style lookups find nothing
+        self.order = []
+        self.values = {}
+        self.selected = ()
+        self.idle = []
+        self._next = 0
+
+    def heading(self, *args, **kwargs):
+        pass
+
+    def column(self, *args, **kwargs):
+        pass
+
+    def bind(self, *args, **kwargs):
+        pass
+
+    def insert(self, parent, index, **kwargs):
+        self._next += 1
+        iid = f'I{self._next}'
+        self.order.append(iid)
+        return iid
+
+    def delete(self, *iids):
+        for iid in iids:
+            self.order.remove(iid)
+            self.values.pop(iid, None)
+
+    def item(self, iid, values=(), tags=()):
+        self.values[iid] = values
+
+    def bbox(self, iid):
+        pos = self.order.index(iid)
+        if pos >= FITS:
+            return ''  # laid out below the visible area
+        return (0, HEADER_H + pos * ROW_H, 400, ROW_H)
+
+    def selection_set(self, iid):
+        self.selected = (iid,)
+
+    def selection(self):
+        return self.selected
+
+    def selection_remove(self, *iids):
+        self.selected = ()
+
+    def focus(self, iid):
+        pass
+
+    def see(self, iid):
+        pass
+
+    def after_idle(self, func):
+        self.idle.append(func)
+        return 'after#1'
+
+    def run_idle(self):
+        while self.idle:
+            self.idle.pop(0)()
+
+
+class FakeScrollbar:
+    def __init__(self, *args, **kwargs):
+        self.range = (0, 1)
+
+    def set(self, first, last):
+        self.range = (first, last)
+
+
+class VirtualTreeviewScrollTest(unittest.TestCase):
+
+    def setUp(self):
+        with mock.patch.object(bcp_dashboard.ttk, 'Treeview', FakeTreeview), \
+                mock.patch.object(bcp_dashboard.ttk, 'Scrollbar', FakeScrollbar):
+            self.table = bcp_dashboard.VirtualTreeview(None, [('n', 'N', 40)], height=10)
+        self.tree = self.table.tree
+        self.rows = [(str(i),) for i in range(100)]
+        # The first <Configure> arrives before any rows are loaded
+        self.table._on_configure(SimpleNamespace(height=WIDGET_H))
+        self.table.set_rows(self.rows)
+        self.tree.run_idle()
+
+    def shown(self):
+        return [self.tree.values[iid] for iid in self.tree.order]
+
+    def test_row_height_measured_after_first_paint(self):
+        self.assertEqual(self.table.visible, FITS)
+        self.assertEqual(len(self.tree.order), FITS)
+
+    def test_scrollbar_reaches_last_row(self):
+        self.table.yview('moveto', '1.0')
+        self.assertEqual(self.shown()[-1], self.rows[-1])
+        self.assertEqual(self.table.scrollbar.range[1], 1)
+
+    def test_end_key_selects_and_shows_last_row(self):
+        self.table._move_selection(len(self.rows))
+        self.assertEqual(self.table.selected, len(self.rows) - 1)
+        self.assertEqual(self.tree.values[self.tree.selection()[0]], self.rows[-1])
+
+    def test_down_key_keeps_selection_in_view(self):
+        for _ in range(FITS + 5):
+            self.table._move_selection(1)
+        self.assertEqual(self.table.selected, FITS + 4)
+        self.assertIn(self.rows[FITS + 4], self.shown())
+        self.assertEqual(self.tree.values[self.tree.selection()[0]], self.rows[FITS + 4])
+
+
+if __name__ == '__main__':
+    unittest.main()